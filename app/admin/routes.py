@@ -2171,7 +2171,8 @@ async def trigger_spk_analysis_from_admin(
         if not pdf_url:
             # Scraper ile bul
             from app.scrapers.spk_bulletin_scraper import SPKBulletinScraper, bulletin_no_str
-            scraper = SPKBulletinScraper()
+            from app.utils.http_client import get_http_client
+            scraper = SPKBulletinScraper(get_http_client(verify=False))
             try:
                 bulletins = await scraper.fetch_bulletin_list(year=2026)
                 target = bulletins[-1] if bulletins else None  # default: en son bülten
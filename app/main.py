@@ -559,6 +559,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Startup 26+ gün temizleyici hatası: %s", e)
 
+    # Paylasimli HTTP client'lar ilk get_http_client() cagrisinda lazy olusur;
+    # lifespan sadece kapanista close_http_client() ile kapatir
+    from app.utils.http_client import close_http_client
+
     # Scheduler'i baslat
     try:
         setup_scheduler()
@@ -577,6 +581,10 @@ async def lifespan(app: FastAPI):
         shutdown_scheduler()
     except Exception:
         pass
+    try:
+        await close_http_client()
+    except Exception:
+        pass
     logger.info("BIST Finans Backend kapatildi.")
 
 
@@ -3598,8 +3606,9 @@ async def admin_reprocess_spk_bulletin(request: Request, payload: dict = Body(..
     from app.services.twitter_service import tweet_spk_bulletin_analysis, _generate_bulletin_analysis_sync
     from app.models.pending_tweet import PendingTweet
     from app.database import async_session
+    from app.utils.http_client import get_http_client
 
-    sc = SPKBulletinScraper()
+    sc = SPKBulletinScraper(get_http_client(verify=False))
     full_text = ""
     try:
         lst = await sc.fetch_bulletin_list(year)
@@ -3609,7 +3618,7 @@ async def admin_reprocess_spk_bulletin(request: Request, payload: dict = Body(..
         _appr, full_text = await sc.process_bulletin(target["pdf_url"], (year, no))
     finally:
         try:
-            await sc.client.aclose()
+            await sc.close()
         except Exception:
             pass
 
@@ -5710,14 +5719,16 @@ async def admin_trigger_spk_check(request: Request, payload: dict, db: AsyncSess
     try:
         from app.scrapers.spk_bulletin_scraper import (
             SPKBulletinScraper, _get_last_bulletin_no, is_newer,
-            bulletin_no_str, extract_text_from_pdf, extract_tables_from_pdf,
+            bulletin_no_str, extract_text_and_tables,
             find_ilk_halka_arz_table, parse_bulletin_no,
         )
         from datetime import date as _date
 
+        from app.utils.http_client import get_http_client
+
         debug_info = {"steps": []}
 
-        scraper = SPKBulletinScraper()
+        scraper = SPKBulletinScraper(get_http_client(verify=False))
         try:
             # 1. Son numarayi al — override varsa kullan
             override_no = payload.get("force_last_no")  # orn: "2026/8"
@@ -5773,8 +5784,7 @@ async def admin_trigger_spk_check(request: Request, payload: dict, db: AsyncSess
             debug_info["steps"].append(f"4. PDF indirildi: {len(pdf_bytes)} bytes")
 
             # PDF parse
-            full_text = extract_text_from_pdf(pdf_bytes)
-            tables = extract_tables_from_pdf(pdf_bytes)
+            full_text, tables = extract_text_and_tables(pdf_bytes)
             debug_info["text_length"] = len(full_text)
             debug_info["table_count"] = len(tables)
             debug_info["text_preview"] = full_text[:500] if full_text else "BOS"
@@ -5865,14 +5875,15 @@ async def admin_trigger_bulletin_analysis_tweet(request: Request, payload: dict)
 
     try:
         from app.scrapers.spk_bulletin_scraper import SPKBulletinScraper, parse_bulletin_no
-        from app.scrapers.spk_bulletin_scraper import extract_text_from_pdf, extract_tables_from_pdf
+        from app.scrapers.spk_bulletin_scraper import extract_text_and_tables
         from app.scrapers.spk_bulletin_scraper import format_tables_for_analysis
 
         bno = parse_bulletin_no(bulletin_no)
         if not bno:
             raise HTTPException(status_code=400, detail="Gecersiz bulten no formati")
 
-        scraper = SPKBulletinScraper()
+        from app.utils.http_client import get_http_client
+        scraper = SPKBulletinScraper(get_http_client(verify=False))
         try:
             bulletins = await scraper.fetch_bulletin_list(year=bno[0])
             target = next((b for b in bulletins if b["bulletin_no"] == bno), None)
@@ -5883,8 +5894,7 @@ async def admin_trigger_bulletin_analysis_tweet(request: Request, payload: dict)
             if not pdf_bytes:
                 return {"status": "error", "message": "PDF indirilemedi"}
 
-            full_text = extract_text_from_pdf(pdf_bytes)
-            tables = extract_tables_from_pdf(pdf_bytes)
+            full_text, tables = extract_text_and_tables(pdf_bytes)
             bulletin_text = format_tables_for_analysis(tables, full_text)
 
             from app.services.twitter_service import tweet_spk_bulletin_analysis
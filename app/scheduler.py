@@ -220,8 +220,9 @@ async def scrape_kap_ipo():
         from app.scrapers.spk_ihrac_scraper import SPKIhracScraper
         from app.services.ipo_service import IPOService
         from app.services.notification import NotificationService
+        from app.utils.http_client import get_http_client
 
-        scraper = SPKIhracScraper()
+        scraper = SPKIhracScraper(get_http_client(verify=False))
         try:
             # fetch_all_years() → mevcut yil + onceki yil (yil gecisi korunmasi)
             all_data = await scraper.fetch_all_years()
@@ -294,6 +295,7 @@ async def scrape_spk():
     try:
         import re
         from app.scrapers.spk_scraper import SPKScraper
+        from app.utils.http_client import get_http_client
         from app.models.spk_application import SPKApplication
         from app.models.ipo import IPO, DeletedIPO
         from sqlalchemy import select
@@ -329,7 +331,7 @@ async def scrape_spk():
                     return True
             return False
 
-        scraper = SPKScraper()
+        scraper = SPKScraper(get_http_client(verify=False))
         try:
             applications = await scraper.fetch_ipo_applications()
             if not applications:
@@ -905,6 +907,23 @@ async def cleanup_old_kap_disclosures():
         logger.error("KAP FIFO cleanup hatasi: %s", e)
 
 
+async def cleanup_spk_pdf_cache():
+    """SPK bulten PDF parse cache'i — PARSED_PDF_TTL_DAYS'ten eski kayitlari siler.
+
+    Gunluk calisir; bulten tick'leri sadece islenen PDF'lerin kayitlarini okur.
+    """
+    try:
+        from app.scrapers.spk_bulletin_scraper import prune_parsed_pdf_cache
+
+        async with async_session() as db:
+            deleted = await prune_parsed_pdf_cache(db)
+            await db.commit()
+            if deleted > 0:
+                logger.info("SPK PDF cache cleanup: %d kayit silindi", deleted)
+    except Exception as e:
+        logger.error("SPK PDF cache cleanup hatasi: %s", e)
+
+
 async def cleanup_expired_coupons():
     """Suresi gecmis kuponlari deaktive eder (her 2 saatte calisir)."""
     try:
@@ -1808,8 +1827,9 @@ async def check_spk_ihrac_data():
         from app.scrapers.spk_ihrac_scraper import SPKIhracScraper
         from sqlalchemy import select, or_
         from app.models.ipo import IPO
+        from app.utils.http_client import get_http_client
 
-        scraper = SPKIhracScraper()
+        scraper = SPKIhracScraper(get_http_client(verify=False))
         try:
             trading_data = await scraper.fetch_trading_dates()
 
@@ -4801,6 +4821,15 @@ def _setup_scheduler_impl():
         replace_existing=True,
     )
 
+    # 7e2. SPK bulten PDF parse cache TTL temizligi — her gece 03:10 TR (UTC 00:10)
+    scheduler.add_job(
+        cleanup_spk_pdf_cache,
+        CronTrigger(hour=0, minute=10),
+        id="spk_pdf_cache_cleanup",
+        name="SPK PDF Cache Cleanup",
+        replace_existing=True,
+    )
+
     # 7g. Mynet oranlari (F/K, PD/DD, FD/FAVOK, Piyasa Degeri) — gunluk 04:00 UTC (TR 07:00)
     async def _mynet_ratios_daily():
         try:
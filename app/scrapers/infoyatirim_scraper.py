@@ -14,9 +14,10 @@ import re
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
+from urllib.parse import urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +30,46 @@ HEADERS = {
     "Accept-Language": "tr-TR,tr;q=0.9",
 }
 
+# Conditional GET cache — url -> (etag, last_modified, parsed_rows)
+# Takvim seyrek degisir; 304 donerse sayfa yeniden parse edilmez.
+_page_cache: dict[str, tuple[Optional[str], Optional[str], list[dict]]] = {}
+
+# scrape_infoyatirim → IPOService'e aktarilan alanlar (None olanlar atlanir)
+_UPDATE_FIELDS = (
+    "ticker", "ipo_price", "subscription_start", "subscription_end",
+    "trading_start", "total_lots", "distribution_method",
+    "distribution_description", "participation_method",
+    "participation_description", "katilim_endeksi",
+)
+
+_TABLE_MARKERS = ("şirket adı", "sirket adi", "hisse kodu")
+
+
+def _cell_text(node) -> str:
+    """BS4 get_text(strip=True) karsiligi — her metin parcasi strip edilip birlestirilir."""
+    return node.text(deep=True, separator="", strip=True)
+
+
+def _is_ipo_table(text: str) -> bool:
+    text = text.lower()
+    return any(marker in text for marker in _TABLE_MARKERS)
+
 
 class InfoYatirimScraper:
     """InfoYatirim halka arz takvimi scraper."""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Disaridan verilen (paylasimli) client'i kapatmayiz — sahibi lifespan
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             timeout=30.0,
             headers=HEADERS,
             follow_redirects=True,
         )
 
     async def close(self):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     async def fetch_all_ipos(self, max_pages: int = 5) -> list[dict]:
         """Tum sayfalardaki halka arzlari getirir.
@@ -69,27 +97,45 @@ class InfoYatirimScraper:
         results = []
 
         try:
-            resp = await self.client.get(url)
+            headers = dict(HEADERS)
+            cached = _page_cache.get(url)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+            resp = await self.client.get(url, headers=headers)
+            if resp.status_code == 304 and cached:
+                return list(cached[2])
             if resp.status_code != 200:
                 logger.warning(f"InfoYatirim sayfa yaniti: {resp.status_code} — {url}")
                 return results
 
-            soup = BeautifulSoup(resp.text, "lxml")
+            tree = LexborHTMLParser(resp.text)
+            tables = tree.css("table")
 
-            # Halka arz tablosunu bul — "Sirket Adi" basligini iceren tablo
+            # Halka arz tablosunu bul — "Sirket Adi" basligini iceren tablo.
+            # Once sadece baslik satiri kontrol edilir; tum tablo metnini
+            # birlestirmek yalnizca baslik satirinda bulunamazsa yapilir.
             table = None
-            for t in soup.find_all("table"):
-                header_text = t.get_text(strip=True).lower()
-                if "şirket adı" in header_text or "sirket adi" in header_text or "hisse kodu" in header_text:
+            for t in tables:
+                head = t.css_first("tr")
+                if head is not None and _is_ipo_table(_cell_text(head)):
                     table = t
                     break
+            if table is None:
+                for t in tables:
+                    if _is_ipo_table(_cell_text(t)):
+                        table = t
+                        break
 
-            if not table:
+            if table is None:
                 return results
 
-            rows = table.find_all("tr")
-            for row in rows:
-                cells = row.find_all("td")
+            for row in table.css("tr"):
+                cells = row.css("td")
                 if len(cells) < 8:
                     continue
 
@@ -97,6 +143,11 @@ class InfoYatirimScraper:
                 if parsed:
                     results.append(parsed)
 
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if results and (etag or last_modified):
+                _page_cache[url] = (etag, last_modified, results)
+
         except Exception as e:
             logger.error(f"InfoYatirim scraping hatasi ({url}): {e}")
 
@@ -105,26 +156,23 @@ class InfoYatirimScraper:
     def _parse_row(self, cells, row) -> Optional[dict]:
         """Tablo satirini parse eder."""
         try:
-            company_name = cells[0].get_text(strip=True)
-            ticker = cells[1].get_text(strip=True).upper()
-            status_raw = cells[2].get_text(strip=True)
-            dates_raw = cells[3].get_text(strip=True)
-            price_raw = cells[4].get_text(strip=True)
-            participants_raw = cells[5].get_text(strip=True)
-            lots_raw = cells[6].get_text(strip=True)
-            trading_start_raw = cells[7].get_text(strip=True)
+            company_name = _cell_text(cells[0])
+            ticker = _cell_text(cells[1]).upper()
+            status_raw = _cell_text(cells[2])
+            dates_raw = _cell_text(cells[3])
+            price_raw = _cell_text(cells[4])
+            participants_raw = _cell_text(cells[5])
+            lots_raw = _cell_text(cells[6])
+            trading_start_raw = _cell_text(cells[7])
 
             # Opsiyonel kolonlar
-            endeks_raw = cells[8].get_text(strip=True) if len(cells) > 8 else ""
-            dagitim_raw = cells[9].get_text(strip=True) if len(cells) > 9 else ""
-            katilim_raw = cells[10].get_text(strip=True) if len(cells) > 10 else ""
+            endeks_raw = _cell_text(cells[8]) if len(cells) > 8 else ""
+            dagitim_raw = _cell_text(cells[9]) if len(cells) > 9 else ""
+            katilim_raw = _cell_text(cells[10]) if len(cells) > 10 else ""
 
-            # Detay sayfasi linki
-            detail_link = row.find("a")
-            detail_url = None
-            if detail_link:
-                href = detail_link.get("href", "")
-                detail_url = href if href.startswith("http") else BASE_URL + href
+            # Detay sayfasi linki — urljoin mutlak/goreli/protokol-goreli href'leri cozer
+            link = row.css_first("a[href]")
+            detail_url = urljoin(BASE_URL, link.attributes["href"] or "") if link is not None else None
 
             # Durum mapping
             status = self._map_status(status_raw)
@@ -144,13 +192,18 @@ class InfoYatirimScraper:
             # Isleme baslama tarihi
             trading_start = self._parse_single_date(trading_start_raw)
 
+            # Kucuk harf donusumu satir basina bir kez — helper'lar tekrar etmez
+            dagitim_lower = dagitim_raw.lower()
+            katilim_lower = katilim_raw.lower()
+            endeks_lower = endeks_raw.lower()
+
             # Dagitim yontemi (kod + aciklama)
-            distribution_code = self._map_distribution(dagitim_raw)
-            distribution_desc = self._distribution_description(dagitim_raw)
+            distribution_code = self._map_distribution(dagitim_raw, dagitim_lower)
+            distribution_desc = self._distribution_description(dagitim_raw, dagitim_lower)
 
             # Katilim yontemi (kod + aciklama)
-            participation_code = self._map_participation(katilim_raw)
-            participation_desc = self._participation_description(katilim_raw)
+            participation_code = self._map_participation(katilim_raw, katilim_lower)
+            participation_desc = self._participation_description(katilim_raw, katilim_lower)
 
             return {
                 "source": "infoyatirim",
@@ -176,8 +229,8 @@ class InfoYatirimScraper:
                 #   bizde 'uygun_degil' çıktı). Artık halkarz/gedik ile aynı sağlam
                 #   mantık: "uygun" geçiyor + "değil" geçmiyorsa uygun.
                 "katilim_endeksi": (
-                    "uygun" if (endeks_raw and "uygun" in endeks_raw.lower()
-                                and "değil" not in endeks_raw.lower())
+                    "uygun" if (endeks_raw and "uygun" in endeks_lower
+                                and "değil" not in endeks_lower)
                     else ("uygun_degil" if endeks_raw else None)
                 ),
                 "detail_url": detail_url,
@@ -321,9 +374,10 @@ class InfoYatirimScraper:
         start, _ = self._parse_date_range(raw)
         return start
 
-    def _map_distribution(self, raw: str) -> Optional[str]:
+    def _map_distribution(self, raw: str, raw_lower: Optional[str] = None) -> Optional[str]:
         """Dagitim yontemi → standart kod."""
-        raw_lower = raw.lower()
+        if raw_lower is None:
+            raw_lower = raw.lower()
         if not raw_lower or raw_lower.strip() in ("-", ""):
             return None
         if "tamamı eşit" in raw_lower or "tamami esit" in raw_lower:
@@ -340,9 +394,10 @@ class InfoYatirimScraper:
             return "karma"
         return raw.strip()
 
-    def _distribution_description(self, raw: str) -> Optional[str]:
+    def _distribution_description(self, raw: str, raw_lower: Optional[str] = None) -> Optional[str]:
         """Dagitim yontemi → kullaniciya anlasilir Turkce aciklama."""
-        raw_lower = raw.lower()
+        if raw_lower is None:
+            raw_lower = raw.lower()
         if not raw_lower or raw_lower.strip() in ("-", ""):
             return None
 
@@ -383,9 +438,10 @@ class InfoYatirimScraper:
 
         return raw.strip()
 
-    def _map_participation(self, raw: str) -> Optional[str]:
+    def _map_participation(self, raw: str, raw_lower: Optional[str] = None) -> Optional[str]:
         """Katilim yontemi → standart kod."""
-        raw_lower = raw.lower()
+        if raw_lower is None:
+            raw_lower = raw.lower()
         if not raw_lower or raw_lower.strip() in ("-", ""):
             return None
         if "borsada" in raw_lower or "borsa" in raw_lower:
@@ -394,9 +450,10 @@ class InfoYatirimScraper:
             return "talep_toplama"
         return raw.strip()
 
-    def _participation_description(self, raw: str) -> Optional[str]:
+    def _participation_description(self, raw: str, raw_lower: Optional[str] = None) -> Optional[str]:
         """Katilim yontemi → kullaniciya anlasilir Turkce aciklama."""
-        raw_lower = raw.lower()
+        if raw_lower is None:
+            raw_lower = raw.lower()
         if not raw_lower or raw_lower.strip() in ("-", ""):
             return None
 
@@ -435,8 +492,9 @@ async def scrape_infoyatirim():
     """
     from app.database import async_session
     from app.services.ipo_service import IPOService
+    from app.utils.http_client import get_http_client
 
-    scraper = InfoYatirimScraper()
+    scraper = InfoYatirimScraper(get_http_client())
     try:
         ipos = await scraper.fetch_all_ipos(max_pages=3)
         if not ipos:
@@ -445,39 +503,32 @@ async def scrape_infoyatirim():
 
         async with async_session() as db:
             ipo_service = IPOService(db)
-            updated_count = 0
+            batch = []
 
             for ipo_data in ipos:
                 company_name = ipo_data.get("company_name")
                 if not company_name:
                     continue
 
-                # Veritabanina kaydet/guncelle
+                # Veritabanina kaydet/guncelle — None olmayan alanlar
                 update_data = {
                     "company_name": company_name,
+                    **{f: v for f in _UPDATE_FIELDS if (v := ipo_data.get(f)) is not None},
                 }
 
-                # None olmayan alanlari ekle
-                for field in ["ticker", "ipo_price", "subscription_start",
-                              "subscription_end", "trading_start", "total_lots",
-                              "distribution_method", "distribution_description",
-                              "participation_method", "participation_description",
-                              "katilim_endeksi"]:
-                    if ipo_data.get(field) is not None:
-                        update_data[field] = ipo_data[field]
-
                 # total_applicants → extra bilgi olarak
-                if ipo_data.get("total_applicants"):
-                    update_data["total_applicants"] = ipo_data["total_applicants"]
+                if total_applicants := ipo_data.get("total_applicants"):
+                    update_data["total_applicants"] = total_applicants
 
                 # Status guard: InfoYatirim mevcut IPO'larin statusunu
                 # override etmez — bu is auto_update_statuses() tarafindan yonetilir.
 
-                await ipo_service.create_or_update_ipo(update_data)
-                updated_count += 1
+                batch.append(update_data)
 
+            # Tek SELECT + tek flush — satir basina DB round-trip yok
+            await ipo_service.bulk_create_or_update(batch)
             await db.commit()
-            logger.info("InfoYatirim: %d halka arz guncellendi", updated_count)
+            logger.info("InfoYatirim: %d halka arz guncellendi", len(batch))
 
     except Exception as e:
         logger.error("InfoYatirim scraper hatasi: %s", e)
@@ -13,6 +13,7 @@ from decimal import Decimal
 from typing import Optional
 
 import httpx
+import orjson
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
@@ -34,19 +35,41 @@ HEADERS = {
     "X-Requested-With": "XMLHttpRequest",
 }
 
+# Halka arz bildirim anahtar kelimeleri — tek alternation, tek C-seviyesi tarama.
+# IGNORECASE i/ı/İ'yi esler; ş/ğ/ü icin ASCII karsiliklari da kabul edilir.
+_IPO_KEYWORDS_RE = re.compile(
+    r"halka arz|izahname|tahsisat|talep toplama"
+    r"|fiyat aral[ıi][gğ][ıi]|sat[ıi][sş] s[üu]resi|da[gğ][ıi]t[ıi]m listesi",
+    re.IGNORECASE,
+)
+
+# Detay metni alanlari — fiyat/lot/tarih tek finditer taramasinda.
+# Her kalip kendi isimli grubunda; alternatifler ayni konumda bu sirayla denenir.
+_DETAIL_FIELDS_RE = re.compile(
+    r"(?:halka\s*arz\s*fiyat[ıi]|pay\s*ba[şs][ıi]na\s*fiyat|birim\s*pay\s*fiyat[ıi])\s*[:=]?\s*(?P<price>\d+[.,]\d{2})\s*(?:TL|tl)"
+    r"|(?P<price_alt>\d+[.,]\d{2})\s*TL\s*(?:olarak|fiyat)"
+    r"|(?P<lots>\d[\d.]*)\s*(?:adet|lot|pay)\s*(?:halka\s*arz|satisa\s*sunul)"
+    r"|toplam\s*(?P<lots_alt>\d[\d.]*)\s*(?:adet|lot|pay)"
+    r"|(?P<date>\d{1,2}[./]\d{1,2}[./]\d{4})",
+    re.IGNORECASE,
+)
+
 
 class KAPScraper:
     """KAP bildirim scraper."""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Disaridan verilen (paylasimli) client'i kapatmayiz — sahibi lifespan
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             timeout=30.0,
             headers=HEADERS,
             follow_redirects=True,
         )
 
     async def close(self):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     # -------------------------------------------------------
     # Halka Arz Bildirimleri
@@ -71,10 +94,11 @@ class KAPScraper:
             resp = await self.client.post(
                 f"{KAP_API_BASE}/memberDisclosureQuery",
                 json=params,
+                headers=HEADERS,
             )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 disclosures = data if isinstance(data, list) else data.get("data", [])
                 for d in disclosures:
                     parsed = self._parse_ipo_disclosure(d)
@@ -99,7 +123,8 @@ class KAPScraper:
         try:
             resp = await self.client.get(
                 KAP_DISCLOSURES,
-                params={"subject": "halka arz"}
+                params={"subject": "halka arz"},
+                headers=HEADERS,
             )
             if resp.status_code != 200:
                 return results
@@ -136,13 +161,8 @@ class KAPScraper:
             company = raw.get("companyName", "") or raw.get("memberName", "")
             ticker = raw.get("stockCode", "") or raw.get("memberCode", "")
 
-            # Halka arz ile ilgili mi kontrol et
-            ipo_keywords = [
-                "halka arz", "izahname", "tahsisat", "talep toplama",
-                "fiyat araligi", "satis suresi", "dagitim listesi"
-            ]
-            text_lower = (title + " " + company).lower()
-            if not any(kw in text_lower for kw in ipo_keywords):
+            # Halka arz ile ilgili mi kontrol et — tek regex taramasi
+            if not _IPO_KEYWORDS_RE.search(title + " " + company):
                 return None
 
             return {
@@ -169,7 +189,7 @@ class KAPScraper:
         """
         try:
             url = f"{KAP_BASE}/tr/Bildirim/{kap_id}"
-            resp = await self.client.get(url)
+            resp = await self.client.get(url, headers=HEADERS)
             if resp.status_code != 200:
                 return None
 
@@ -182,13 +202,14 @@ class KAPScraper:
 
             text = content_div.get_text(separator="\n", strip=True)
 
-            # Metin icerisinden halka arz detaylarini cikar
+            # Metin icerisinden halka arz detaylarini cikar (tek regex taramasi)
+            ipo_price, subscription_dates, total_lots = self._extract_fields(text)
             detail = {
                 "kap_id": kap_id,
                 "full_text": text,
-                "ipo_price": self._extract_price(text),
-                "subscription_dates": self._extract_dates(text),
-                "total_lots": self._extract_lots(text),
+                "ipo_price": ipo_price,
+                "subscription_dates": subscription_dates,
+                "total_lots": total_lots,
                 "distribution_method": self._extract_distribution(text),
             }
 
@@ -229,24 +250,24 @@ class KAPScraper:
             resp = await self.client.post(
                 f"{KAP_API_BASE}/memberDisclosureQuery",
                 json=params,
+                headers=HEADERS,
             )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 disclosures = data if isinstance(data, list) else data.get("data", [])
 
-                for d in disclosures:
-                    try:
-                        results.append({
-                            "kap_id": str(d.get("disclosureIndex", d.get("id", ""))),
-                            "company_name": d.get("companyName", d.get("memberName", "")),
-                            "ticker": (d.get("stockCode", d.get("memberCode", "")) or "").upper(),
-                            "subject": d.get("disclosureTitle", d.get("subject", "")),
-                            "published_at": d.get("publishDate", d.get("disclosureDate")),
-                            "url": f"{KAP_BASE}/tr/Bildirim/{d.get('disclosureIndex', '')}",
-                        })
-                    except Exception:
-                        continue
+                # Hizli yol: tek comprehension, satir basina try/except yok.
+                # Bozuk bir satir varsa bir kez korumali donguye dusulur.
+                try:
+                    results = [self._latest_row(d) for d in disclosures]
+                except Exception:
+                    results = []
+                    for d in disclosures:
+                        try:
+                            results.append(self._latest_row(d))
+                        except Exception:
+                            continue
             else:
                 logger.warning(f"KAP latest API: {resp.status_code}")
 
@@ -255,46 +276,56 @@ class KAPScraper:
 
         return results
 
+    @staticmethod
+    def _latest_row(d: dict) -> dict:
+        """KAP API satirini haber akisi formatina donusturur."""
+        index = d.get("disclosureIndex")
+        return {
+            "kap_id": str(index or d.get("id") or ""),
+            "company_name": d.get("companyName") or d.get("memberName") or "",
+            "ticker": (d.get("stockCode") or d.get("memberCode") or "").upper(),
+            "subject": d.get("disclosureTitle") or d.get("subject") or "",
+            "published_at": d.get("publishDate") or d.get("disclosureDate"),
+            "url": f"{KAP_BASE}/tr/Bildirim/{index or ''}",
+        }
+
     # -------------------------------------------------------
     # Yardimci Fonksiyonlar — Metin Icerisinden Bilgi Cikarma
     # -------------------------------------------------------
 
-    def _extract_price(self, text: str) -> Optional[Decimal]:
-        """Metinden halka arz fiyatini cikarir."""
-        patterns = [
-            r"(?:halka\s*arz\s*fiyat[ıi]|pay\s*ba[şs][ıi]na\s*fiyat|birim\s*pay\s*fiyat[ıi])\s*[:=]?\s*(\d+[.,]\d{2})\s*(?:TL|tl)",
-            r"(\d+[.,]\d{2})\s*TL\s*(?:olarak|fiyat)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1).replace(",", ".")
-                return Decimal(price_str)
-        return None
+    def _extract_fields(self, text: str) -> tuple[Optional[Decimal], dict, Optional[int]]:
+        """Metinden fiyat, basvuru tarihleri ve lot miktarini tek taramada cikarir.
+
+        Oncelik eski ayri aramalarla ayni: fiyat icin once etiketli kalip
+        (halka arz fiyati: 21,50 TL), yoksa "21,50 TL olarak"; lot icin once
+        "... adet halka arz", yoksa "toplam ... adet". Tarihler ilk ve son
+        dd.mm.yyyy eslesmesi (en az iki tarih varsa).
+        """
+        first: dict[str, str] = {}
+        found_dates: list[str] = []
+        for m in _DETAIL_FIELDS_RE.finditer(text):
+            kind = m.lastgroup
+            if kind == "date":
+                found_dates.append(m.group(kind))
+            elif kind not in first:
+                first[kind] = m.group(kind)
+
+        price = None
+        price_str = first.get("price") or first.get("price_alt")
+        if price_str:
+            price = Decimal(price_str.replace(",", "."))
+
+        lots = None
+        lots_str = first.get("lots") or first.get("lots_alt")
+        if lots_str:
+            lots = int(lots_str.replace(".", ""))
 
-    def _extract_dates(self, text: str) -> dict:
-        """Metinden basvuru tarihlerini cikarir."""
         dates = {}
-        # dd.mm.yyyy veya dd/mm/yyyy formatinda tarih ara
-        date_pattern = r"(\d{1,2}[./]\d{1,2}[./]\d{4})"
-        found = re.findall(date_pattern, text)
-        if len(found) >= 2:
-            dates["start"] = found[0]
-            dates["end"] = found[-1]
-        return dates
-
-    def _extract_lots(self, text: str) -> Optional[int]:
-        """Metinden toplam lot/pay miktarini cikarir."""
-        patterns = [
-            r"(\d[\d.]*)\s*(?:adet|lot|pay)\s*(?:halka\s*arz|satisa\s*sunul)",
-            r"toplam\s*(\d[\d.]*)\s*(?:adet|lot|pay)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                num_str = match.group(1).replace(".", "")
-                return int(num_str)
-        return None
+        if len(found_dates) >= 2:
+            dates["start"] = found_dates[0]
+            dates["end"] = found_dates[-1]
+
+        return price, dates, lots
 
     def _extract_distribution(self, text: str) -> Optional[str]:
         """Dagitim yontemini tespit eder."""
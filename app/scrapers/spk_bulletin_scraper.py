@@ -21,14 +21,18 @@ Kaynak: https://spk.gov.tr/spk-bultenleri/{yil}-yili-spk-bultenleri
 import io
 import re
 import json
+import hashlib
 import asyncio
 import logging
-from datetime import date, datetime
+import time
+import functools
+import operator
+from datetime import date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
 
 import httpx
 import pdfplumber
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +49,55 @@ HEADERS = {
 # DB state key — son islenmis bulten numarasi
 SCRAPER_STATE_KEY = "spk_last_bulletin_no"
 
+# Bulten listesi conditional GET cache'i — yil -> {etag, last_modified, bulletins}
+# Liste sayfasi gunde en fazla bir kez degisir; 304 gelirse sayfa parse edilmez.
+# Restart'ta kaybolmasin diye entrypoint ScraperState'e yazar/okur.
+LISTING_CACHE_KEY_TEMPLATE = "spk_listing_cache_{year}"
+_listing_cache: dict[int, dict] = {}
+# Monitor yogun saatte 1 dk'da bir calisir — bu sure onu geciktirmez, sadece
+# ayni anda gelen diger cagiranlari (catch-up, admin) ayni yanita baglar.
+# Paylasim ayni client'i kullananlar arasindadir — (id(client), yil) anahtari;
+# disaridan verilen ozel client (test, farkli verify/proxy) atlanmaz.
+LISTING_FRESH_SECONDS = 30
+_listing_inflight: dict[tuple[int, int], asyncio.Future] = {}
+
+# Birikmis bultenlerde ayni anda indirilip parse edilecek PDF sayisi
+PROCESS_CONCURRENCY = 3
+
+# Parse edilmis PDF cache'i — ScraperState key'i "spk_pdf_{sha256}".
+# Restart / yeniden deneme ayni PDF'i indirirse parse atlanir.
+PARSED_PDF_KEY_PREFIX = "spk_pdf_"
+PARSED_PDF_TTL_DAYS = 60
+_DECIMAL_FIELDS = ("existing_capital", "new_capital")
+
 # Race condition korumasi — ayni anda iki kez calismasin
 _spk_check_lock = asyncio.Lock()
 
+# Modul seviyesinde derlenmis regex'ler — liste sayfasindaki yuzlerce link ve
+# her tablo satiri icin re modulu cache lookup'i tekrarlanmasin.
+_BULLETIN_NO_RE = re.compile(r"(\d{4})\s*/\s*(\d+)")
+_BULLETIN_NO_HREF_RE = re.compile(r"(\d{4})\s*[-/]\s*(\d+)")  # href: ".../2026-8.pdf"
+_FOOTNOTE_RE = re.compile(r"\s*\(\d+\)\s*$")  # "Sirket AS (1)" -> dipnot
+_FOOTNOTE_ONLY_RE = re.compile(r"^\(\d+\)\s*$")  # Sadece "(1)" satiri
+_LEADING_PAREN_RE = re.compile(r"^\([^)]*\)\s*")  # "(MetropolCard) Sirket..."
+_WHITESPACE_RE = re.compile(r"\s+")
+# Ilk Halka Arz tablosunda sirket olmayan satirlar: dipnot/kaynak/toplam
+# basliklari + teblig/yonetmelik isimleri ("...Iliskin Esaslar Tebligi").
+# Tek startswith(tuple) + tek regex taramasi ("tebliği" zaten "tebliğ" icerir).
+_JUNK_NAME_PREFIXES = ("kaynak", "not:", "toplam")
+_JUNK_NAME_RE = re.compile(r"tebliğ|esaslar|yönetmelik")
+
+# _clean_number: TR sayi formati tek translate gecisinde normalize edilir
+# (bosluk ve binlik nokta silinir, ondalik virgul -> nokta)
+_NUM_TRANS = str.maketrans({" ": None, ".": None, ",": "."})
+_EMPTY_NUM_TOKENS = frozenset(("-", "\u2013", ""))
+
+# bulletin_no zaten (yil, no) tuple'i — dogal tuple siralamasi dogru sirayi verir
+_BY_BULLETIN_NO = operator.itemgetter("bulletin_no")
+
+# Header'in devam satiri mi? (Ilk Halka Arz tablosu cok satirli baslik)
+_HEADER_CONT_KEYWORDS = ("fiyat", "tür", "tur", "sat", "pay")
+
 
 # -------------------------------------------------------
 # Yardimci: Bulten numarasi parse/karsilastirma
@@ -55,7 +105,7 @@ _spk_check_lock = asyncio.Lock()
 
 def parse_bulletin_no(text: str) -> tuple[int, int] | None:
     """'2026/8' veya 'Bulten No : 2026/8' gibi text'ten (yil, no) cikarir."""
-    m = re.search(r"(\d{4})\s*/\s*(\d+)", text)
+    m = _BULLETIN_NO_RE.search(text)
     if m:
         return (int(m.group(1)), int(m.group(2)))
     return None
@@ -81,36 +131,36 @@ def is_newer(candidate: tuple[int, int], current: tuple[int, int] | None) -> boo
 # PDF Icerik Okuma
 # -------------------------------------------------------
 
-def extract_text_from_pdf(pdf_bytes: bytes) -> str:
-    """PDF bytes'indan tum text'i cikarir (pdfplumber)."""
-    text_parts = []
-    try:
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-    except Exception as e:
-        logger.error("PDF text cikarma hatasi: %s", e)
-    return "\n".join(text_parts)
-
+def extract_text_and_tables(pdf_bytes: bytes) -> tuple[str, list[list[list[str]]]]:
+    """PDF'i TEK KEZ acip hem text'i hem tablolari cikarir (pdfplumber).
 
-def extract_tables_from_pdf(pdf_bytes: bytes) -> list[list[list[str]]]:
-    """PDF'den tum tablolari cikarir.
+    pdfplumber'da asil maliyet sayfa basina pdfminer layout analizi; text ve
+    tablolar icin PDF'i iki ayri kez acmak bu isi iki kez yaptiriyordu.
 
     Returns:
-        [table1, table2, ...] — her tablo = [[cell, cell, ...], ...]
+        (full_text, [table1, table2, ...]) — her tablo = [[cell, cell, ...], ...]
     """
+    text_parts = []
     all_tables = []
     try:
         with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+            # NOT: "Ilk Halka Arzlar" bolumunden sonra erken cikis YAPILMAZ —
+            # tum sayfalarin text + tablolari format_tables_for_analysis ile
+            # bulten AI analizine (tweet + push ozeti) gidiyor; sermaye
+            # artirimi vb. sonraki bolumler kesilirse analiz eksik kalir.
             for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    text_parts.append(page_text)
                 tables = page.extract_tables()
                 if tables:
                     all_tables.extend(tables)
+                # Sayfanin char/layout cache'ini birak — 60 sayfalik bultende
+                # tum sayfalarin nesneleri bellekte birikmesin
+                page.close()
     except Exception as e:
-        logger.error("PDF tablo cikarma hatasi: %s", e)
-    return all_tables
+        logger.error("PDF text/tablo cikarma hatasi: %s", e)
+    return "\n".join(text_parts), all_tables
 
 
 # -------------------------------------------------------
@@ -176,22 +226,62 @@ def _clean_number(val: str | None) -> Decimal | None:
     """
     if not val:
         return None
+    return _clean_number_cached(val)
+
+
+@functools.lru_cache(maxsize=2048)
+def _clean_number_cached(val: str) -> Decimal | None:
+    """_clean_number'in cache'li govdesi — tablolarda "-", bos hucre ve
+    tekrar eden degerler cok sik geliyor. Decimal immutable, paylasmak guvenli."""
     # Newline ve dipnot referanslarini temizle: "12,05\n(2)" -> "12,05"
     val = val.split("\n")[0].strip()
-    val = re.sub(r"\s*\(\d+\)\s*$", "", val).strip()
-    val = val.replace(" ", "")
-    if val in ("-", "\u2013", ""):
-        return None
-    # Turkce format: nokta = binlik, virgul = ondalik
+    val = _FOOTNOTE_RE.sub("", val).strip()
+    # Turkce format: nokta = binlik, virgul = ondalik — tek translate gecisi
+    # (bosluk + nokta silinir, virgul -> nokta)
     # 141.000.000 -> 141000000
     # 22,00 -> 22.00
-    val = val.replace(".", "").replace(",", ".")
+    val = val.translate(_NUM_TRANS)
+    if val in _EMPTY_NUM_TOKENS:
+        return None
     try:
         return Decimal(val)
     except (InvalidOperation, ValueError):
         return None
 
 
+@functools.lru_cache(maxsize=2048)
+def _clean_float(val: str) -> float | None:
+    """_clean_number'in float karsiligi — satis fiyati taramasi icin.
+
+    Kucuk fiyat degerlerinde Decimal hassasiyetine gerek yok; sermaye
+    tutarlari (buyuk tam sayilar) icin _clean_number kullanilmaya devam eder.
+    """
+    if not val:
+        return None
+    val = val.split("\n")[0].strip()
+    val = _FOOTNOTE_RE.sub("", val).strip()
+    val = val.translate(_NUM_TRANS)
+    if val in _EMPTY_NUM_TOKENS:
+        return None
+    try:
+        return float(val)
+    except ValueError:
+        return None
+
+
+# SPK tablolarinda header hep ilk 1-3 satirda; ilk 5 satirda yoksa tablo
+# hedef degil (mali tablolar, ekler) — geri kalan satirlar taranmaz.
+_HEADER_SEARCH_ROWS = 5
+
+
+def _row_strs(table: list[list[str]]) -> list[str]:
+    """Tablonun her satiri icin birlesik, kucuk harfli metin.
+
+    pdfplumber hucreleri zaten str veya None — str() cagrisina gerek yok.
+    """
+    return [" ".join(c or "" for c in row).lower() for row in table]
+
+
 def find_ilk_halka_arz_table(tables: list[list[list[str]]], full_text: str) -> list[dict]:
     """'Ilk Halka Arzlar' tablosunu bulup sirketleri cikarir.
 
@@ -205,9 +295,12 @@ def find_ilk_halka_arz_table(tables: list[list[list[str]]], full_text: str) -> l
     - "2. Halka Acik Ortakliklarin Pay Ihraclari" → header'da "Satis Turu" / "tur" bulunur
     Sadece "Satis Fiyati" iceren tablo = gercek Ilk Halka Arz tablosu.
 
+    full_text artik okunmuyor (bkz. asagidaki "full_text fallback KALDIRILDI"
+    notu) — imza cagiranlar icin korunuyor; tablo basina metin lower() yapilmaz.
+
     Returns:
         [{"company_name", "existing_capital", "new_capital",
-          "sale_price"}, ...]
+          "sale_price" (float)}, ...]
     """
     results = []
 
@@ -215,11 +308,14 @@ def find_ilk_halka_arz_table(tables: list[list[list[str]]], full_text: str) -> l
         if not table or len(table) < 2:
             continue
 
+        # Her satirin birlesik kucuk harf metni bir kez uretilir — header
+        # arama ve komsu satir kontrolleri ayni listeyi kullanir
+        row_strs = _row_strs(table)
+
         # Header satirini bul — "Ortaklik" veya "Mevcut Sermaye" iceren satir
         header_idx = None
         header_row_text = ""
-        for i, row in enumerate(table):
-            row_text = " ".join(str(c or "") for c in row).lower()
+        for i, row_text in enumerate(row_strs[:_HEADER_SEARCH_ROWS]):
             if "ortakl" in row_text and ("sermaye" in row_text or "mevcut" in row_text):
                 header_idx = i
                 header_row_text = row_text
@@ -242,16 +338,16 @@ def find_ilk_halka_arz_table(tables: list[list[list[str]]], full_text: str) -> l
         for offset in range(1, 3):
             check_idx = header_idx + offset
             if check_idx < len(table) and table[check_idx]:
-                extra_text = " ".join(str(c or "") for c in table[check_idx]).lower()
+                extra_text = row_strs[check_idx]
                 # Eger bu satir hala header gibi gorunuyorsa (sayi icermeyen)
-                if any(kw in extra_text for kw in ["fiyat", "tür", "tur", "sat", "pay"]):
+                if any(kw in extra_text for kw in _HEADER_CONT_KEYWORDS):
                     expanded_header += " " + extra_text
 
         # Onceki satirlari da kontrol et (bazen tablo basligi ayri satirda)
         for offset in range(1, 3):
             check_idx = header_idx - offset
             if check_idx >= 0 and check_idx < len(table) and table[check_idx]:
-                extra_text = " ".join(str(c or "") for c in table[check_idx]).lower()
+                extra_text = row_strs[check_idx]
                 expanded_header += " " + extra_text
 
         # "Satis Turu" iceriyorsa → Sermaye Artirimi tablosu, atla
@@ -281,38 +377,35 @@ def find_ilk_halka_arz_table(tables: list[list[list[str]]], full_text: str) -> l
             company_name = str(row[0] or "").strip()
             # Newline'lari bosluklara cevir (PDF tablo satir kırılmasi)
             company_name = company_name.replace("\n", " ").replace("\r", " ")
-            company_name = re.sub(r"\s+", " ", company_name).strip()
+            company_name = _WHITESPACE_RE.sub(" ", company_name).strip()
             if not company_name or len(company_name) < 3:
                 continue
 
             # Kisa notlari temizle: "(1)", "(2)" gibi dipnotlar
-            company_name = re.sub(r"\s*\(\d+\)\s*$", "", company_name).strip()
+            company_name = _FOOTNOTE_RE.sub("", company_name).strip()
 
             # Basta gelen parantez icindeki marka/tanitim isimlerini temizle:
             # "(MetropolCard) Metropal Kurumsal..." → "Metropal Kurumsal..."
-            company_name = re.sub(r"^\([^)]*\)\s*", "", company_name).strip()
+            company_name = _LEADING_PAREN_RE.sub("", company_name).strip()
+
+            # Newline'lar yukarida temizlendi, isim strip'li — kucuk harf
+            # karsiligi tek kez uretilip asagidaki tum kontrollerde kullanilir
+            lower_name = company_name.lower()
 
             # "Ortaklik" header kelimesini atla — ama "Ortaklik" TAMAMEN header ise
             # Sirket adi "... Ortakligi AS" olabilir, bunu ATLAMA!
-            cn_lower = company_name.lower().replace("\n", " ")
-            if cn_lower.strip() in ("ortaklık", "ortaklik", "ortaklık adı"):
+            if lower_name in ("ortaklık", "ortaklik", "ortaklık adı"):
                 continue
 
             # Dipnot / kaynak / toplam satirlarini atla
             # DIKKAT: Sadece satirin TAMAMI bu kelimelerden olusuyorsa atla.
             # Sirket adinda "(1)" veya "kaynak" gecebilir — onu ATLAMA.
-            lower_name = company_name.lower()
             # Tamamen dipnot veya aciklama satiri mi?
             # Ayrica teblig/yonetmelik isimleri sirket degildir
             is_junk_row = (
-                lower_name.startswith("kaynak")
-                or lower_name.startswith("not:")
-                or lower_name.startswith("toplam")
-                or re.match(r"^\(\d+\)\s*$", company_name)  # Sadece "(1)" gibi
-                or "tebliğ" in lower_name  # Teblig isimleri sirket degil
-                or "tebliği" in lower_name
-                or "esaslar" in lower_name  # "...İlişkin Esaslar Tebliği"
-                or "yönetmelik" in lower_name
+                lower_name.startswith(_JUNK_NAME_PREFIXES)
+                or _FOOTNOTE_ONLY_RE.match(company_name)  # Sadece "(1)" gibi
+                or _JUNK_NAME_RE.search(lower_name)  # Teblig/yonetmelik isimleri sirket degil
             )
             if is_junk_row:
                 continue
@@ -328,8 +421,9 @@ def find_ilk_halka_arz_table(tables: list[list[list[str]]], full_text: str) -> l
 
             # Satis fiyati — genellikle son veya sondan bir onceki sutun
             # Turkce tablo: Ortaklik | Mevcut | Yeni | Bedelli | Bedelsiz | Pay Satisi | Ek Pay | Fiyat
+            # (float yeterli — deger zaten ipo_price'a float() ile yaziliyor)
             for col_idx in range(len(row) - 1, 2, -1):
-                val = _clean_number(str(row[col_idx] or ""))
+                val = _clean_float(row[col_idx] or "")
                 if val is not None and val < 10000:  # Satis fiyati < 10.000 TL mantikli
                     sale_price = val
                     break
@@ -360,9 +454,10 @@ def find_halka_acik_pay_ihraclari(tables: list[list[list[str]]]) -> list[dict]:
         if not table or len(table) < 2:
             continue
 
+        row_strs = _row_strs(table)
+
         header_idx = None
-        for i, row in enumerate(table):
-            row_text = " ".join(str(c or "") for c in row).lower()
+        for i, row_text in enumerate(row_strs[:_HEADER_SEARCH_ROWS]):
             if "ortakl" in row_text and ("sat" in row_text) and ("tur" in row_text or "tür" in row_text):
                 header_idx = i
                 break
@@ -370,19 +465,18 @@ def find_halka_acik_pay_ihraclari(tables: list[list[list[str]]]) -> list[dict]:
         if header_idx is None:
             continue
 
-        for row in table[header_idx + 1:]:
+        for row, row_text in zip(table[header_idx + 1:], row_strs[header_idx + 1:]):
             if not row or not any(row):
                 continue
 
             # "Halka Arz" satirlarini ara
-            row_text = " ".join(str(c or "") for c in row).lower()
             if "halka" not in row_text:
                 continue
 
             company_name = str(row[0] or "").strip()
-            company_name = re.sub(r"\s*\(\d+\)\s*$", "", company_name).strip()
+            company_name = _FOOTNOTE_RE.sub("", company_name).strip()
             # Basta gelen parantez icindeki marka isimlerini temizle
-            company_name = re.sub(r"^\([^)]*\)\s*", "", company_name).strip()
+            company_name = _LEADING_PAREN_RE.sub("", company_name).strip()
             if not company_name or len(company_name) < 3:
                 continue
 
@@ -407,8 +501,10 @@ def find_halka_acik_pay_ihraclari(tables: list[list[list[str]]]) -> list[dict]:
 class SPKBulletinScraper:
     """SPK Bulten scraper — numara tabanli, PDF parse."""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        # Disaridan verilen (paylasimli) client'i kapatmayiz — sahibi lifespan
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             timeout=30.0,
             headers=HEADERS,
             follow_redirects=True,
@@ -416,79 +512,160 @@ class SPKBulletinScraper:
         )
 
     async def close(self):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
+
+    @staticmethod
+    def _collect_bulletin_links(links) -> list[dict]:
+        """(href, text) ciftlerinden bulten kayitlarini cikarir."""
+        results = []
+        for href, text in links:
+            if not text:
+                continue
+
+            # Bulten numarasi cikar — "yyyy/n" '/' icermeyen metinde (menu,
+            # footer linkleri) regex hic calistirilmaz
+            bno = parse_bulletin_no(text) if "/" in text else None
+            if not bno:
+                # href'ten de dene: .../2026-8.pdf — '-' ve '/' ayni regex'te,
+                # link basina replace() ile yeni string uretilmez
+                m = _BULLETIN_NO_HREF_RE.search(href)
+                if not m:
+                    continue
+                bno = (int(m.group(1)), int(m.group(2)))
+
+            # URL'yi tam yap
+            if href.startswith("/"):
+                href = SPK_BASE + href
+            elif not href.startswith("http"):
+                continue
+
+            results.append({
+                "bulletin_no": bno,
+                "title": text,
+                "pdf_url": href,
+            })
+        return results
 
     async def fetch_bulletin_list(self, year: int | None = None) -> list[dict]:
         """SPK bulten sayfasindan bulten listesini getirir.
 
+        Ayni client + yil icin es zamanli cagrilar (monitor + catch-up + admin,
+        hepsi ortak client'ta) tek istegi paylasir; LISTING_FRESH_SECONDS
+        icinde ayni client ile alinmis liste tekrar istenmeden dondurulur.
+
         Returns:
             [{bulletin_no: (year, no), title, pdf_url}, ...] — no'ya gore sirali
         """
         if year is None:
             year = date.today().year
 
+        client_id = id(self.client)
+        cached = _listing_cache.get(year)
+        if (
+            cached
+            and cached.get("fetched_via") == client_id
+            and time.monotonic() - cached.get("fetched_at", 0.0) < LISTING_FRESH_SECONDS
+        ):
+            return [dict(b) for b in cached["bulletins"]]
+
+        # Gorev self'i (ve client'i) tuttugu surece id tekrar kullanilamaz
+        key = (client_id, year)
+        task = _listing_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_bulletin_list(year))
+            _listing_inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: _listing_inflight.pop(k, None))
+        # shield: bir cagiranin iptali paylasilan istegi iptal etmesin
+        results = await asyncio.shield(task)
+        return [dict(b) for b in results]
+
+    async def _fetch_bulletin_list(self, year: int) -> list[dict]:
+        """fetch_bulletin_list'in ag + parse govdesi (conditional GET)."""
         url = SPK_BULLETIN_URL_TEMPLATE.format(year=year)
         results = []
 
         try:
-            resp = await self.client.get(url)
+            headers = dict(HEADERS)
+            cached = _listing_cache.get(year)
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+            resp = await self.client.get(url, headers=headers)
+            if resp.status_code == 304 and cached:
+                cached["fetched_at"] = time.monotonic()
+                cached["fetched_via"] = id(self.client)
+                results = [dict(b) for b in cached["bulletins"]]
+                logger.info("SPK: bulten listesi degismedi (304, yil=%d, %d bulten)", year, len(results))
+                return results
             if resp.status_code != 200:
                 logger.warning("SPK bulten sayfasi yanitlamadi: %d", resp.status_code)
                 return results
 
-            soup = BeautifulSoup(resp.text, "lxml")
-
-            for link in soup.find_all("a", href=True):
-                href = link.get("href", "")
-                text = link.get_text(strip=True)
-
-                if not text:
-                    continue
-
-                # Bulten numarasi cikar
-                bno = parse_bulletin_no(text)
-                if not bno:
-                    # href'ten de dene: .../2026-8.pdf
-                    bno = parse_bulletin_no(href.replace("-", "/"))
-                if not bno:
-                    continue
-
-                # URL'yi tam yap
-                if href.startswith("/"):
-                    href = SPK_BASE + href
-                elif not href.startswith("http"):
-                    continue
-
-                results.append({
-                    "bulletin_no": bno,
-                    "title": text,
-                    "pdf_url": href,
-                })
+            # Lexbor DOM — sadece a[href] dugumleri sorgulanir
+            tree = LexborHTMLParser(resp.text)
+            results = self._collect_bulletin_links(
+                (link.attributes.get("href") or "", link.text(deep=True, separator="", strip=True))
+                for link in tree.css("a[href]")
+            )
 
             # Numara sirasina gore sirala
-            results.sort(key=lambda x: (x["bulletin_no"][0], x["bulletin_no"][1]))
+            results.sort(key=_BY_BULLETIN_NO)
             logger.info("SPK: %d bulten listelendi (yil=%d)", len(results), year)
 
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if results and (etag or last_modified):
+                _listing_cache[year] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "bulletins": [dict(b) for b in results],
+                    "persisted": False,
+                    "fetched_at": time.monotonic(),
+                    "fetched_via": id(self.client),
+                }
+
         except Exception as e:
             logger.error("SPK bulten listesi hatasi: %s", e)
 
         return results
 
     async def download_pdf(self, pdf_url: str) -> bytes | None:
-        """PDF dosyasini indirir."""
+        """PDF dosyasini stream ederek indirir.
+
+        Status / content-type header'lar gelir gelmez kontrol edilir — SPK
+        bakim/SSL hatasinda donen HTML sayfasinin govdesi hic indirilmez.
+        Content-Length varsa buffer bastan o boyutta ayrilir.
+        """
         try:
-            resp = await self.client.get(pdf_url)
-            if resp.status_code != 200:
-                logger.warning("SPK PDF indirilemedi: %s -> %d", pdf_url, resp.status_code)
-                return None
+            async with self.client.stream("GET", pdf_url, headers=HEADERS) as resp:
+                if resp.status_code != 200:
+                    logger.warning("SPK PDF indirilemedi: %s -> %d", pdf_url, resp.status_code)
+                    return None
 
-            content_type = resp.headers.get("content-type", "")
-            if "pdf" not in content_type and not pdf_url.endswith(".pdf"):
-                logger.warning("SPK: beklenen PDF degil: %s (%s)", pdf_url, content_type)
-                return None
+                content_type = resp.headers.get("content-type", "")
+                if "pdf" not in content_type and not pdf_url.endswith(".pdf"):
+                    logger.warning("SPK: beklenen PDF degil: %s (%s)", pdf_url, content_type)
+                    return None
 
-            logger.info("SPK PDF indirildi: %s (%d bytes)", pdf_url, len(resp.content))
-            return resp.content
+                try:
+                    size = int(resp.headers.get("content-length", "0"))
+                except ValueError:
+                    size = 0
+                buf = bytearray(size)
+                offset = 0
+                async for chunk in resp.aiter_bytes(65536):
+                    # Slice atamasi buffer sonunu gecerse otomatik uzar
+                    # (sikistirilmis yanitta cozulmus boyut Content-Length'i asabilir)
+                    buf[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                del buf[offset:]
+
+            logger.info("SPK PDF indirildi: %s (%d bytes)", pdf_url, offset)
+            return bytes(buf)
 
         except Exception as e:
             logger.error("SPK PDF indirme hatasi: %s", e)
@@ -496,57 +673,136 @@ class SPKBulletinScraper:
 
     async def process_bulletin(
         self, pdf_url: str, bulletin_no: tuple[int, int],
+        parsed_cache: dict[str, dict] | None = None,
     ) -> tuple[list[dict], str]:
         """Tek bir bulteni indir, parse et, halka arz bilgilerini cikar.
 
         Returns:
             (approvals, full_bulletin_text) — halka arz onaylari + AI analiz icin tam bulten metni
         """
-        bno_str = bulletin_no_str(*bulletin_no)
-
-        # 1. PDF indir
         pdf_bytes = await self.download_pdf(pdf_url)
+        return await self._parse_downloaded(pdf_bytes, pdf_url, bulletin_no, parsed_cache)
+
+    async def _parse_downloaded(
+        self, pdf_bytes: bytes | None, pdf_url: str, bulletin_no: tuple[int, int],
+        parsed_cache: dict[str, dict] | None = None,
+    ) -> tuple[list[dict], str]:
+        """Indirilmis bulten PDF'ini parse eder.
+
+        PDF parse CPU-yogun oldugu icin thread'de calisir — event loop bloklanmaz.
+        parsed_cache verilirse (sha256 -> sonuc) ayni PDF ikinci kez parse edilmez;
+        yeni sonuclar da bu dict'e yazilir (bkz. _save_parsed_pdf_cache).
+        """
+        bno_str = bulletin_no_str(*bulletin_no)
         if not pdf_bytes:
             logger.warning("SPK bulten %s: PDF indirilemedi", bno_str)
             return [], ""
 
-        # 2. PDF'den text + tablo cikar
-        full_text = extract_text_from_pdf(pdf_bytes)
-        tables = extract_tables_from_pdf(pdf_bytes)
+        digest = hashlib.sha256(pdf_bytes).hexdigest() if parsed_cache is not None else None
+        if digest and digest in parsed_cache:
+            logger.info("SPK bulten %s: PDF degismemis (sha256 cache) — parse atlandi", bno_str)
+            approvals, text = parsed_cache[digest]["result"]
+            return [dict(a) for a in approvals], text
+
+        approvals, text = await asyncio.to_thread(parse_bulletin_pdf, pdf_bytes, pdf_url, bulletin_no)
+        if digest and text:
+            parsed_cache[digest] = {
+                "result": ([dict(a) for a in approvals], text),
+                "persisted": False,
+            }
+        return approvals, text
+
+    async def download_pdfs(self, bulletins: list[dict]) -> list[bytes | None]:
+        """Birden fazla bultenin PDF'ini es zamanli indirir (bulletins sirasiyla)."""
+        sem = asyncio.Semaphore(PROCESS_CONCURRENCY)
+
+        async def _run(bulletin: dict) -> bytes | None:
+            async with sem:
+                return await self.download_pdf(bulletin["pdf_url"])
+
+        return await asyncio.gather(*(_run(b) for b in bulletins))
+
+    async def process_bulletins(
+        self, bulletins: list[dict], pdfs: list[bytes | None],
+        parsed_cache: dict[str, dict] | None = None,
+    ) -> list[tuple[list[dict], str]]:
+        """download_pdfs ile indirilmis bultenleri es zamanli parse eder.
+
+        Indirme once yapilir ki cagiran taraf sadece bu PDF'lerin sha256'larini
+        cache'ten yukleyebilsin (bkz. _load_parsed_pdf_cache). Sonuclar
+        bulletins sirasiyla doner; DB islemleri cagiran tarafta sirayla yapilir.
+        """
+        sem = asyncio.Semaphore(PROCESS_CONCURRENCY)
 
-        logger.info(
-            "SPK bulten %s parse: %d karakter text, %d tablo",
-            bno_str, len(full_text), len(tables),
-        )
+        async def _run(bulletin: dict, pdf_bytes: bytes | None) -> tuple[list[dict], str]:
+            async with sem:
+                return await self._parse_downloaded(
+                    pdf_bytes, bulletin["pdf_url"], bulletin["bulletin_no"], parsed_cache,
+                )
 
-        if not full_text and not tables:
-            logger.warning("SPK bulten %s: PDF bos veya okunamadi", bno_str)
-            return [], ""
+        return await asyncio.gather(*(_run(b, p) for b, p in zip(bulletins, pdfs)))
 
-        # 3. Tum bulten icerigini AI analiz formatina cevir
-        full_bulletin_text = format_tables_for_analysis(tables, full_text)
 
-        # 4. SADECE Ilk Halka Arzlar tablosu — sermaye artirimi tablolari atlanir
-        ipo_approvals = find_ilk_halka_arz_table(tables, full_text)
+def parse_bulletin_pdf(
+    pdf_bytes: bytes, pdf_url: str, bulletin_no: tuple[int, int],
+) -> tuple[list[dict], str]:
+    """Indirilmis bulten PDF'ini parse eder (senkron, saf CPU isi).
 
-        # NOT: find_halka_acik_pay_ihraclari() artik kullanilmiyor.
-        # Sermaye artirimi verileri ileride ayri bir islevle islenecek.
+    Returns:
+        (approvals, full_bulletin_text) — halka arz onaylari + AI analiz icin tam bulten metni
+    """
+    bno_str = bulletin_no_str(*bulletin_no)
 
-        all_approvals = ipo_approvals
+    # 1. PDF'den text + tablo cikar (tek gecis)
+    full_text, tables = extract_text_and_tables(pdf_bytes)
 
-        # Meta bilgi ekle
-        for approval in all_approvals:
-            approval["bulletin_no"] = bno_str
-            approval["bulletin_url"] = pdf_url
-            if "approval_type" not in approval:
-                approval["approval_type"] = "ilk_halka_arz"
+    logger.info(
+        "SPK bulten %s parse: %d karakter text, %d tablo",
+        bno_str, len(full_text), len(tables),
+    )
 
-        logger.info(
-            "SPK bulten %s: %d halka arz onayi tespit edildi",
-            bno_str, len(all_approvals),
-        )
+    if not full_text and not tables:
+        logger.warning("SPK bulten %s: PDF bos veya okunamadi", bno_str)
+        return [], ""
+
+    # 2. Tum bulten icerigini AI analiz formatina cevir
+    full_bulletin_text = format_tables_for_analysis(tables, full_text)
+
+    # 3. SADECE Ilk Halka Arzlar tablosu — sermaye artirimi tablolari atlanir
+    ipo_approvals = find_ilk_halka_arz_table(tables, full_text)
 
-        return all_approvals, full_bulletin_text
+    # NOT: find_halka_acik_pay_ihraclari() artik kullanilmiyor.
+    # Sermaye artirimi verileri ileride ayri bir islevle islenecek.
+
+    all_approvals = ipo_approvals
+
+    # Meta bilgi ekle
+    for approval in all_approvals:
+        approval["bulletin_no"] = bno_str
+        approval["bulletin_url"] = pdf_url
+        if "approval_type" not in approval:
+            approval["approval_type"] = "ilk_halka_arz"
+
+    logger.info(
+        "SPK bulten %s: %d halka arz onayi tespit edildi",
+        bno_str, len(all_approvals),
+    )
+
+    return all_approvals, full_bulletin_text
+
+
+def _approval_ipo_data(approval: dict, today: date) -> dict:
+    """Bulten onayindan IPOService'e gidecek veri dict'i."""
+    ipo_data = {
+        "company_name": approval["company_name"],
+        "spk_bulletin_url": approval.get("bulletin_url"),
+        "spk_bulletin_no": approval.get("bulletin_no"),
+        "spk_approval_date": today,
+        "status": "newly_approved",
+    }
+    if approval.get("sale_price"):
+        ipo_data["ipo_price"] = float(approval["sale_price"])
+    return ipo_data
 
 
 # -------------------------------------------------------
@@ -588,6 +844,163 @@ async def _save_last_bulletin_no(db, bulletin_no: tuple[int, int]):
         db.add(state)
 
 
+async def _load_listing_cache(db, year: int):
+    """ScraperState'teki bulten listesi cache'ini bellege yukler (yoksa)."""
+    if year in _listing_cache:
+        return
+    from sqlalchemy import select
+    from app.models.scraper_state import ScraperState
+
+    result = await db.execute(
+        select(ScraperState).where(
+            ScraperState.key == LISTING_CACHE_KEY_TEMPLATE.format(year=year)
+        )
+    )
+    state = result.scalar_one_or_none()
+    if not state or not state.value:
+        return
+    try:
+        data = json.loads(state.value)
+        _listing_cache[year] = {
+            "etag": data.get("etag"),
+            "last_modified": data.get("last_modified"),
+            "bulletins": [
+                {"bulletin_no": tuple(b["bulletin_no"]), "title": b["title"], "pdf_url": b["pdf_url"]}
+                for b in data["bulletins"]
+            ],
+            "persisted": True,
+        }
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning("SPK liste cache okunamadi (yil=%d): %s", year, e)
+
+
+async def _save_listing_cache(db, year: int) -> bool:
+    """Yeni alinan bulten listesi cache'ini ScraperState'e yazar (commit etmez).
+
+    Returns:
+        True — yazilacak degisiklik vardi
+    """
+    entry = _listing_cache.get(year)
+    if not entry or entry.get("persisted"):
+        return False
+    from sqlalchemy import select
+    from app.models.scraper_state import ScraperState
+
+    key = LISTING_CACHE_KEY_TEMPLATE.format(year=year)
+    value = json.dumps({
+        "etag": entry.get("etag"),
+        "last_modified": entry.get("last_modified"),
+        "bulletins": [
+            {"bulletin_no": list(b["bulletin_no"]), "title": b["title"], "pdf_url": b["pdf_url"]}
+            for b in entry["bulletins"]
+        ],
+    }, ensure_ascii=False)
+    result = await db.execute(select(ScraperState).where(ScraperState.key == key))
+    state = result.scalar_one_or_none()
+    if state:
+        state.value = value
+        state.updated_at = datetime.utcnow()
+    else:
+        db.add(ScraperState(key=key, value=value))
+    entry["persisted"] = True
+    return True
+
+
+async def _load_parsed_pdf_cache(db, pdfs: list[bytes | None]) -> dict[str, dict]:
+    """Sadece verilen PDF'lerin (sha256) parse cache kayitlarini yukler.
+
+    Returns:
+        {sha256: {"result": (approvals, full_bulletin_text), "persisted": True}}
+    """
+    from sqlalchemy import select
+    from app.models.scraper_state import ScraperState
+
+    keys = {f"{PARSED_PDF_KEY_PREFIX}{hashlib.sha256(p).hexdigest()}" for p in pdfs if p}
+    if not keys:
+        return {}
+    result = await db.execute(select(ScraperState).where(ScraperState.key.in_(keys)))
+
+    cache = {}
+    for state in result.scalars().all():
+        try:
+            data = json.loads(state.value)
+            approvals = data["approvals"]
+            for approval in approvals:
+                for field in _DECIMAL_FIELDS:
+                    if approval.get(field) is not None:
+                        approval[field] = Decimal(approval[field])
+            cache[state.key[len(PARSED_PDF_KEY_PREFIX):]] = {
+                "result": (approvals, data["text"]),
+                "persisted": True,
+            }
+        except (ValueError, KeyError, TypeError, InvalidOperation) as e:
+            logger.warning("SPK PDF cache okunamadi (%s): %s", state.key, e)
+    return cache
+
+
+async def _save_parsed_pdf_cache(db, cache: dict[str, dict]) -> bool:
+    """Yeni parse edilen PDF sonuclarini ScraperState'e yazar (commit etmez).
+
+    Key zaten varsa (yukleme hatasi / es zamanli yazim) satir guncellenir —
+    key UNIQUE, duz insert IntegrityError ile tum batch'i geri aldirirdi.
+
+    Returns:
+        True — yazilacak degisiklik vardi
+    """
+    from sqlalchemy import select
+    from app.models.scraper_state import ScraperState
+
+    pending = {
+        f"{PARSED_PDF_KEY_PREFIX}{digest}": entry
+        for digest, entry in cache.items()
+        if not entry["persisted"]
+    }
+    if not pending:
+        return False
+
+    result = await db.execute(select(ScraperState).where(ScraperState.key.in_(pending)))
+    existing = {state.key: state for state in result.scalars().all()}
+
+    for key, entry in pending.items():
+        approvals, text = entry["result"]
+        value = json.dumps({
+            "approvals": [
+                {k: (str(v) if k in _DECIMAL_FIELDS and v is not None else v) for k, v in a.items()}
+                for a in approvals
+            ],
+            "text": text,
+        }, ensure_ascii=False)
+        state = existing.get(key)
+        if state:
+            state.value = value
+            state.updated_at = datetime.utcnow()
+        else:
+            db.add(ScraperState(key=key, value=value))
+        entry["persisted"] = True
+    return True
+
+
+async def prune_parsed_pdf_cache(db) -> int:
+    """PARSED_PDF_TTL_DAYS'ten eski parse cache kayitlarini siler (commit etmez).
+
+    Gunluk temizlik job'undan cagrilir — bulten tick'inde calismaz.
+
+    Returns:
+        Silinen kayit sayisi
+    """
+    from sqlalchemy import delete
+    from app.models.scraper_state import ScraperState
+
+    cutoff = datetime.utcnow() - timedelta(days=PARSED_PDF_TTL_DAYS)
+    result = await db.execute(
+        delete(ScraperState).where(
+            ScraperState.key.like(f"{PARSED_PDF_KEY_PREFIX}%"),
+            ScraperState.updated_at < cutoff,
+        )
+    )
+    return result.rowcount or 0
+
+
 # Bos PDF retry takibi — SPK linki PDF'ten once yayinlayabiliyor.
 # Yogun saatte monitor her 1 dk calisir → 30 deneme ≈ 30 dk.
 EMPTY_PDF_MAX_RETRY = 30
@@ -675,8 +1088,11 @@ async def _check_spk_bulletins_inner():
     from app.database import async_session
     from app.services.ipo_service import IPOService
     from app.services.notification import NotificationService
+    from app.utils.http_client import get_http_client
 
-    scraper = SPKBulletinScraper()
+    # Paylasimli client (verify=False) — liste + PDF istekleri ayni
+    # keep-alive baglantiyi tick'ler arasinda kullanir
+    scraper = SPKBulletinScraper(get_http_client(verify=False))
     try:
         async with async_session() as db:
             # 1. Son islenmis numarayi al
@@ -684,16 +1100,36 @@ async def _check_spk_bulletins_inner():
 
             # 2. Bulten listesi al (mevcut yil)
             current_year = date.today().year
-            bulletins = await scraper.fetch_bulletin_list(year=current_year)
-
-            # Yil gecisi kontrolu
             today = date.today()
+            listing_years = [current_year]
             if today.month == 12 and today.day >= 15:
-                next_year_bulletins = await scraper.fetch_bulletin_list(year=current_year + 1)
-                bulletins.extend(next_year_bulletins)
+                listing_years.append(current_year + 1)
             if today.month == 1 and today.day <= 15:
-                prev_year_bulletins = await scraper.fetch_bulletin_list(year=current_year - 1)
-                bulletins.extend(prev_year_bulletins)
+                listing_years.append(current_year - 1)
+
+            # Conditional GET cache'i (ETag/Last-Modified) restart sonrasi da gecerli
+            for _year in listing_years:
+                await _load_listing_cache(db, _year)
+
+            # Yil gecisinde iki sayfa es zamanli cekilir (ayni host, ortak
+            # keep-alive client) — sure toplam degil en yavas istek kadar.
+            # fetch_bulletin_list hatayi kendi yutar, TaskGroup iptal etmez.
+            async with asyncio.TaskGroup() as tg:
+                listing_tasks = [
+                    tg.create_task(scraper.fetch_bulletin_list(year=_year))
+                    for _year in listing_years
+                ]
+            bulletins = [b for task in listing_tasks for b in task.result()]
+
+            try:
+                _cache_dirty = False
+                for _year in listing_years:
+                    _cache_dirty = await _save_listing_cache(db, _year) or _cache_dirty
+                if _cache_dirty:
+                    await db.commit()
+            except Exception as _cache_err:
+                logger.warning("SPK liste cache kaydedilemedi: %s", _cache_err)
+                await db.rollback()
 
             if not bulletins:
                 logger.info("SPK Monitor: sayfada hic bulten yok")
@@ -703,7 +1139,7 @@ async def _check_spk_bulletins_inner():
             # boylece SADECE bundan sonra gelecek yeni bulteni yakalar.
             # Ama eger sayfadaki en son bulten bugun yayinlandiysa onu isle.
             if last_no is None:
-                max_b = max(bulletins, key=lambda x: (x["bulletin_no"][0], x["bulletin_no"][1]))
+                max_b = max(bulletins, key=_BY_BULLETIN_NO)
                 max_no = max_b["bulletin_no"]
                 # Son bulteni islenmis olarak kaydet — bir sonraki yeni geldiginde yakalanir
                 last_no = (max_no[0], max_no[1] - 1) if max_no[1] > 1 else (max_no[0] - 1, 999)
@@ -721,7 +1157,7 @@ async def _check_spk_bulletins_inner():
             ]
 
             if not new_bulletins:
-                max_b = max(bulletins, key=lambda x: (x["bulletin_no"][0], x["bulletin_no"][1]))
+                max_b = max(bulletins, key=_BY_BULLETIN_NO)
                 logger.info(
                     "SPK Monitor: yeni bulten yok (son: %s, islenmis: %s)",
                     bulletin_no_str(*max_b["bulletin_no"]),
@@ -741,17 +1177,33 @@ async def _check_spk_bulletins_inner():
             total_approvals = 0
             highest_no = last_no
 
-            for bulletin in sorted(new_bulletins, key=lambda x: x["bulletin_no"]):
+            ordered_bulletins = sorted(new_bulletins, key=_BY_BULLETIN_NO)
+
+            # ★ ONCE tum PDF'leri indir + parse et (es zamanli — birikmis
+            # bultenler paralel indirilir, sonra paralel parse edilir). SPK bazen linki PDF'ten
+            # once yayinliyor (2026/36 vakasi) — icerik yoksa bulteni ISLENMIS
+            # SAYMA, push da ATMA; sonraki calismada otomatik yeniden dene.
+            pdfs = await scraper.download_pdfs(ordered_bulletins)
+            try:
+                parsed_cache = await _load_parsed_pdf_cache(db, pdfs)
+            except Exception as _pc_err:
+                logger.warning("SPK PDF cache yuklenemedi: %s", _pc_err)
+                await db.rollback()
+                parsed_cache = {}
+
+            parsed = await scraper.process_bulletins(ordered_bulletins, pdfs, parsed_cache)
+
+            try:
+                await _save_parsed_pdf_cache(db, parsed_cache)
+                await db.commit()
+            except Exception as _pc_err:
+                logger.warning("SPK PDF cache kaydedilemedi: %s", _pc_err)
+                await db.rollback()
+
+            for bulletin, (approvals, full_bulletin_text) in zip(ordered_bulletins, parsed):
                 bno = bulletin["bulletin_no"]
                 bno_str_val = bulletin_no_str(*bno)
 
-                # ★ ONCE PDF'i indir + parse et. SPK bazen linki PDF'ten once
-                # yayinliyor (2026/36 vakasi) — icerik yoksa bulteni ISLENMIS
-                # SAYMA, push da ATMA; sonraki calismada otomatik yeniden dene.
-                approvals, full_bulletin_text = await scraper.process_bulletin(
-                    bulletin["pdf_url"], bno,
-                )
-
                 if not approvals and not full_bulletin_text:
                     retry_count = await _bump_empty_pdf_retry(db, bno_str_val)
                     if retry_count < EMPTY_PDF_MAX_RETRY:
@@ -833,25 +1285,32 @@ async def _check_spk_bulletins_inner():
                 _bulletin_notif_summary = ""
                 _analiz_already_tweeted = False
 
+                # Eslestirme icin IPO tablosu bulten basina BIR KEZ okunur
+                # (onay basina tum tabloyu fuzzy icin yeniden okumak yerine);
+                # kayit yine onay-bazli savepoint + commit ile izole kalir.
+                ipo_lookup = await ipo_service.load_lookup() if approvals else None
+
                 for approval in approvals:
                     # ★ HER ONAY İZOLE (24.06.2026): bir onay patlarsa (örn 5.
                     #   sıradaki şirket) diğerleri + zaten commit'lenenler ETKİLENMESİN.
                     #   Eskiden tek try yoktu → 5. onayda exception TÜM loop'u kırıp
                     #   rollback ediyordu (4 push gitmiş, 0 IPO kalmıştı — Golda vakası).
                     try:
-                        ipo_data = {
-                            "company_name": approval["company_name"],
-                            "spk_bulletin_url": approval.get("bulletin_url"),
-                            "spk_bulletin_no": approval.get("bulletin_no"),
-                            "spk_approval_date": today,
-                            "status": "newly_approved",
-                        }
-                        if approval.get("sale_price"):
-                            ipo_data["ipo_price"] = float(approval["sale_price"])
-
-                        ipo = await ipo_service.create_or_update_ipo(
-                            ipo_data, allow_create=True,
-                        )
+                        try:
+                            async with db.begin_nested():
+                                ipo = await ipo_service.upsert_with_lookup(
+                                    _approval_ipo_data(approval, today), ipo_lookup,
+                                    allow_create=True,
+                                )
+                        except Exception as _upsert_err:
+                            logger.error(
+                                "SPK IPO kayit hatasi (%s): %s — bu onay atlandi",
+                                approval.get("company_name"), _upsert_err,
+                            )
+                            # Savepoint geri alindi — lookup'taki anahtarlar/yeni satir
+                            # DB ile uyumsuz olabilir, tabloyu yeniden oku
+                            ipo_lookup = await ipo_service.load_lookup()
+                            continue
 
                         # SPKApplication tablosunda varsa → approved yap
                         try:
@@ -889,6 +1348,10 @@ async def _check_spk_bulletins_inner():
                                 approval.get("company_name"), _ipo_commit_err,
                             )
                             await db.rollback()
+                            # Tam rollback tum instance'lari expire eder (async'te lazy
+                            # load yok) — IPO tablosunu yeniden okumak hem lookup'i hem
+                            # onceki onaylarda commit'lenmis IPO'lari tazeler
+                            ipo_lookup = await ipo_service.load_lookup()
                             continue
 
                         if ipo:
@@ -943,6 +1406,8 @@ async def _check_spk_bulletins_inner():
                         )
                         try:
                             await db.rollback()
+                            # Expire olan IPO instance'larini + lookup'i tazele
+                            ipo_lookup = await ipo_service.load_lookup()
                         except Exception:
                             pass
                         continue
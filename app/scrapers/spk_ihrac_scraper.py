@@ -26,12 +26,14 @@ Amac:
 Her 2 saatte bir calisir (scheduler.py job #10).
 """
 
+import asyncio
 import logging
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import Optional
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -45,11 +47,35 @@ HEADERS = {
 }
 
 
+def _to_decimal(value) -> Decimal | None:
+    """API sayisal alani -> Decimal.
+
+    JSON'dan int/float/str gelebilir; int dogrudan, float repr ile (str()
+    ile ayni sonuc) cevrilir — exception sadece gecersiz string'de olusur.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return Decimal(value)
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, str):
+        value = value.strip()
+        if value:
+            try:
+                return Decimal(value)
+            except InvalidOperation:
+                return None
+    return None
+
+
 class SPKIhracScraper:
     """SPK ihrac verileri — REST API ile halka arz islem verileri."""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Disaridan verilen (paylasimli) client'i kapatmayiz — sahibi lifespan
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             timeout=30.0,
             headers=HEADERS,
             follow_redirects=True,
@@ -57,7 +83,8 @@ class SPKIhracScraper:
         )
 
     async def close(self):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     async def fetch_trading_dates(self, year: int | None = None) -> list[dict]:
         """SPK API'den halka arz islem tarihlerini ve detaylarini ceker.
@@ -78,21 +105,20 @@ class SPKIhracScraper:
             resp = await self.client.get(
                 SPK_API_URL,
                 params={"yil": year},
+                headers=HEADERS,
             )
 
             if resp.status_code != 200:
                 logger.warning("SPK ihrac API yaniti: %d", resp.status_code)
                 return results
 
-            data = resp.json()
+            data = orjson.loads(resp.content)
             if not isinstance(data, list):
                 logger.warning("SPK ihrac API: Beklenmeyen format — list degil")
                 return results
 
-            for item in data:
-                parsed = self._parse_item(item)
-                if parsed:
-                    results.append(parsed)
+            parse_item = self._parse_item
+            results = [parsed for item in data if (parsed := parse_item(item))]
 
             logger.info("SPK ihrac API: %d halka arz islem verisi (%d)", len(results), year)
 
@@ -114,58 +140,43 @@ class SPKIhracScraper:
             current_year = date.today().year
             years = [current_year, current_year - 1]
 
-        all_results = []
-        for year in years:
-            results = await self.fetch_trading_dates(year)
-            all_results.extend(results)
-
-        return all_results
+        # Yillar birbirinden bagimsiz — istekler paralel gider (ayni HTTP/2
+        # baglantisi uzerinden), sonuc sirasi yil sirasini korur.
+        per_year = await asyncio.gather(
+            *(self.fetch_trading_dates(year) for year in years)
+        )
+        return [r for results in per_year for r in results]
 
     def _parse_item(self, item: dict) -> dict | None:
         """API JSON objesini standart formata donusturur."""
         if not isinstance(item, dict):
             return None
 
-        ticker = item.get("borsaKodu", "").strip()
-        company_name = item.get("sirketUnvani", "").strip()
+        get = item.get
+        ticker = (get("borsaKodu") or "").strip()
+        company_name = (get("sirketUnvani") or "").strip()
 
         if not ticker or not company_name:
             return None
 
         # Islem tarihi parse — ISO format: "2026-01-22T00:00:00"
-        trading_date = self._parse_iso_date(item.get("borsadaIslemGormeTarihi"))
+        trading_date = self._parse_iso_date(get("borsadaIslemGormeTarihi"))
 
         # Fiyat
-        ipo_price = None
-        raw_price = item.get("halkaArzFiyatiTl")
-        if raw_price is not None:
-            try:
-                ipo_price = Decimal(str(raw_price))
-            except Exception:
-                pass
+        ipo_price = _to_decimal(get("halkaArzFiyatiTl"))
 
         # Halka arz buyuklugu (bin TL → TL)
-        offering_size_tl = None
-        raw_size = item.get("satisaSunulanToplamTutarPiyasaDegeriBinTl")
-        if raw_size is not None:
-            try:
-                offering_size_tl = Decimal(str(raw_size)) * 1000  # bin TL → TL
-            except Exception:
-                pass
+        offering_size_tl = _to_decimal(get("satisaSunulanToplamTutarPiyasaDegeriBinTl"))
+        if offering_size_tl is not None:
+            offering_size_tl *= 1000  # bin TL → TL
 
         # Araci kurum — tirnak isareti ve newline temizle
-        lead_broker = item.get("halkaArzaAracilikEdenKurum", "")
+        lead_broker = get("halkaArzaAracilikEdenKurum", "")
         if lead_broker:
             lead_broker = lead_broker.strip().strip('"').replace("\n", ", ")
 
         # Halka arz orani
-        public_float_pct = None
-        raw_pct = item.get("halkaArzOrani")
-        if raw_pct is not None:
-            try:
-                public_float_pct = Decimal(str(raw_pct))
-            except Exception:
-                pass
+        public_float_pct = _to_decimal(get("halkaArzOrani"))
 
         return {
             "source": "spk_ihrac",
@@ -173,12 +184,12 @@ class SPKIhracScraper:
             "company_name": company_name,
             "trading_start_date": trading_date,
             "ipo_price": ipo_price,
-            "market_segment": item.get("ilkIslemGorduguPazar", ""),
+            "market_segment": get("ilkIslemGorduguPazar", ""),
             "lead_broker": lead_broker,
             "offering_size_tl": offering_size_tl,
             "public_float_pct": public_float_pct,
-            "ipo_method": item.get("halkaArzSekli", ""),
-            "period": item.get("donem", ""),
+            "ipo_method": get("halkaArzSekli", ""),
+            "period": get("donem", ""),
         }
 
     def _parse_iso_date(self, date_str: str | None) -> date | None:
@@ -191,6 +202,17 @@ class SPKIhracScraper:
         if not date_str:
             return None
 
+        # Hizli yol: API hep "YYYY-MM-DD..." dondurur — dilimleme + int()
+        if (
+            isinstance(date_str, str) and len(date_str) >= 10
+            and date_str[4] == "-" and date_str[7] == "-"
+            and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:10].isdigit()
+        ):
+            try:
+                return date(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:10]))
+            except ValueError:
+                return None
+
         try:
             # ISO format: "2026-01-22T00:00:00"
             return datetime.fromisoformat(date_str).date()
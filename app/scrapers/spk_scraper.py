@@ -11,7 +11,7 @@ from datetime import date, datetime
 from typing import Optional
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +25,23 @@ HEADERS = {
 }
 
 
+def _cell_text(node) -> str:
+    """BS4 get_text(strip=True) karsiligi — her metin parcasi strip edilip birlestirilir."""
+    return node.text(deep=True, separator="", strip=True)
+
+
+def _is_company_table(text: str) -> bool:
+    text = text.lower()
+    return "şirketler" in text or "sirketler" in text
+
+
 class SPKScraper:
     """SPK Ilk Halka Arz Basvurusu listesi scraper."""
 
-    def __init__(self):
-        self.client = httpx.AsyncClient(
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        # Disaridan verilen (paylasimli) client'i kapatmayiz — sahibi lifespan
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             timeout=30.0,
             headers=HEADERS,
             follow_redirects=True,
@@ -37,7 +49,8 @@ class SPKScraper:
         )
 
     async def close(self):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     async def fetch_ipo_applications(self) -> list[dict]:
         """SPK'daki tum halka arz basvurularini getirir.
@@ -53,40 +66,46 @@ class SPKScraper:
         results = []
 
         try:
-            resp = await self.client.get(SPK_IPO_URL)
+            resp = await self.client.get(SPK_IPO_URL, headers=HEADERS)
             if resp.status_code != 200:
                 logger.warning(f"SPK sayfa yaniti: {resp.status_code}")
                 return results
 
-            soup = BeautifulSoup(resp.text, "lxml")
+            tree = LexborHTMLParser(resp.text)
+            tables = tree.css("table")
 
-            # Ana tabloyu bul — "Sirketler" basligini iceren tablo
+            # Ana tabloyu bul — "Sirketler" basligini iceren tablo.
+            # Once sadece baslik satiri kontrol edilir; tum tablo metnini
+            # birlestirmek yalnizca baslik satirinda bulunamazsa yapilir.
             table = None
-            for t in soup.find_all("table"):
-                header_text = t.get_text(strip=True).lower()
-                if "şirketler" in header_text or "sirketler" in header_text:
+            for t in tables:
+                head = t.css_first("tr")
+                if head is not None and _is_company_table(_cell_text(head)):
                     table = t
                     break
+            if table is None:
+                for t in tables:
+                    if _is_company_table(_cell_text(t)):
+                        table = t
+                        break
 
-            if not table:
+            if not table and tables:
                 # Fallback: sayfadaki en buyuk tabloyu al
-                tables = soup.find_all("table")
-                if tables:
-                    table = max(tables, key=lambda t: len(t.find_all("tr")))
+                table = max(tables, key=lambda t: len(t.css("tr")))
 
             if not table:
                 logger.warning("SPK: Tablo bulunamadi")
                 return results
 
-            rows = table.find_all("tr")
+            rows = table.css("tr")
             for row in rows:
-                cells = row.find_all("td")
+                cells = row.css("td")
                 if len(cells) < 3:
                     continue
 
-                row_num = cells[0].get_text(strip=True)
-                company_name = cells[1].get_text(strip=True)
-                date_str = cells[2].get_text(strip=True)
+                row_num = _cell_text(cells[0])
+                company_name = _cell_text(cells[1])
+                date_str = _cell_text(cells[2])
 
                 # Sira numarasi kontrolu — baslik satirini atla
                 if not row_num.isdigit():
@@ -111,8 +130,21 @@ class SPKScraper:
         return results
 
     def _parse_date(self, date_str: str) -> Optional[date]:
-        """dd.mm.yyyy formatindaki tarihi parse eder."""
+        """dd.mm.yyyy formatindaki tarihi parse eder.
+
+        Sayfadaki tarihler hep sifir dolgulu (01.02.2026) — dilimleme + int()
+        ile parse edilir; farkli bicimler (1.2.2026) strptime'a duser.
+        """
+        try:
+            s = date_str.strip()
+        except AttributeError:
+            return None
+        if len(s) == 10 and s[2] == "." and s[5] == "." and s.replace(".", "").isdigit():
+            try:
+                return date(int(s[6:]), int(s[3:5]), int(s[:2]))
+            except ValueError:
+                return None
         try:
-            return datetime.strptime(date_str.strip(), "%d.%m.%Y").date()
-        except (ValueError, AttributeError):
+            return datetime.strptime(s, "%d.%m.%Y").date()
+        except ValueError:
             return None
@@ -18,14 +18,16 @@ Konfigürasyon:
 
 import re
 import asyncio
+import functools
 import logging
 from datetime import datetime, date, timezone, timedelta
 from decimal import Decimal
 
-import httpx
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import async_session
 from app.models.telegram_news import TelegramNews
 
@@ -34,6 +36,44 @@ TZ_TR = timezone(timedelta(hours=3))
 
 logger = logging.getLogger(__name__)
 
+# ── Arka plan görev takibi (GC koruması) ────────────────────────────
+_bg_tasks: set = set()
+
+def _fire_and_forget(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+    return task
+
+# KAP tweet'leri SIRAYLA — tweet_kap_news'in sembol cooldown'u ve dedup cache'i
+# kontrol-sonra-yaz (atomik degil); iki thread ayni anda ayni hisseyi tweetleyebilir
+_KAP_TWEET_LOCK = asyncio.Lock()
+
+
+async def _send_kap_tweet(
+    flow: str, notify_source: str, notify_detail: str,
+    ticker: str, keyword: str, sentiment: str, **kwargs,
+) -> None:
+    """tweet_kap_news'i arka planda calistirir, sonucu admin'e bildirir.
+
+    tweet_kap_news senkron (gorsel uretimi + HTTP + rate-limit beklemesi
+    dakikalar surebilir) — poll dongusu beklemesin diye _fire_and_forget ile
+    baslatilir; thread'de ve _KAP_TWEET_LOCK altinda tek tek calisir.
+    """
+    try:
+        from app.services.twitter_service import tweet_kap_news
+        from app.services.admin_telegram import notify_tweet_sent
+
+        async with _KAP_TWEET_LOCK:
+            ok = await asyncio.to_thread(tweet_kap_news, ticker, keyword, sentiment, **kwargs)
+        logger.info(
+            "[%s] KAP tweet sonuc: %s (basarili=%s, ai_score=%s)",
+            flow, ticker, ok, kwargs.get("ai_score"),
+        )
+        await notify_tweet_sent(notify_source, ticker, ok, notify_detail)
+    except Exception as e:
+        logger.error("[%s] KAP tweet gorevi hatasi (%s): %s", flow, ticker, e, exc_info=True)
+
 
 async def _router_err(category: str, err, ticker: str = ""):
     """KAP router kategori-parse hatasini hem logla hem Telegram'a bildir.
@@ -201,37 +241,48 @@ _last_heartbeat: float = 0.0  # Periyodik status log zamani
 _last_kap_push_per_ticker: dict[str, float] = {}
 _KAP_PUSH_COOLDOWN_SEC = 120  # 2 dakika
 
+# getUpdates long polling suresi. Scheduler job'u 3sn'de bir tetikliyor
+# (max_instances=1) — bekleme tick'ten kisa tutulur ki sonraki tick
+# "max instances" ile atlanmasin. Bu surede gelen mesaj aninda doner.
+LONG_POLL_TIMEOUT_SEC = 2
+
 
 async def fetch_telegram_updates(bot_token: str, offset: int | None = None) -> list[dict]:
     """Telegram getUpdates API'sini cagir.
 
-    timeout=0: Aninda cevap al (long polling kullanma).
-    Bu sayede 10 sn aralikla cagrildiginda cakisma olmaz.
+    timeout=LONG_POLL_TIMEOUT_SEC: Bekleyen update yoksa Telegram baglantiyi
+    kisa sure acik tutar, bu arada gelen mesaj hemen doner (bir sonraki
+    tick'i beklemez). Sure scheduler araligindan kisa — cakisma olmaz.
     409 Conflict: Baska bir process ayni token'i kullaniyor — webhook kaldir + tekrar dene.
     """
     url = f"{TELEGRAM_API_BASE.format(token=bot_token)}/getUpdates"
-    params = {"timeout": 0, "limit": 100}  # timeout=0: long polling yok, aninda yanit
+    params = {"timeout": LONG_POLL_TIMEOUT_SEC, "limit": 100}
     if offset is not None:
         params["offset"] = offset
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.get(url, params=params)
+    # Uygulama genelindeki paylasimli client — her poll'da yeni TCP+TLS
+    # baglantisi kurulmaz. HTTP timeout long polling suresinden uzun olmali.
+    from app.utils.http_client import get_http_client
+    client = get_http_client()
+    timeout = LONG_POLL_TIMEOUT_SEC + 10
 
-        # 409 Conflict — webhook ayarli olabilir, kaldirmaya calis
-        if resp.status_code == 409:
-            logger.warning("Telegram 409 Conflict — webhook kaldiriliyor...")
-            try:
-                delete_url = f"{TELEGRAM_API_BASE.format(token=bot_token)}/deleteWebhook"
-                await client.post(delete_url)
-                logger.info("Telegram webhook kaldirildi, tekrar deneniyor...")
-                # Tekrar dene
-                resp = await client.get(url, params=params)
-            except Exception as e:
-                logger.error("Webhook kaldirma hatasi: %s", e)
-                return []
+    resp = await client.get(url, params=params, timeout=timeout)
 
-        resp.raise_for_status()
-        data = resp.json()
+    # 409 Conflict — webhook ayarli olabilir, kaldirmaya calis
+    if resp.status_code == 409:
+        logger.warning("Telegram 409 Conflict — webhook kaldiriliyor...")
+        try:
+            delete_url = f"{TELEGRAM_API_BASE.format(token=bot_token)}/deleteWebhook"
+            await client.post(delete_url, timeout=timeout)
+            logger.info("Telegram webhook kaldirildi, tekrar deneniyor...")
+            # Tekrar dene
+            resp = await client.get(url, params=params, timeout=timeout)
+        except Exception as e:
+            logger.error("Webhook kaldirma hatasi: %s", e)
+            return []
+
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
 
     if not data.get("ok"):
         logger.warning("Telegram API hatasi: %s", data)
@@ -391,6 +442,14 @@ def parse_ticker(text: str) -> str | None:
     return tickers[0] if tickers else None
 
 
+# Sembol satiri — sonraki satira kadar (\n ile durur)
+_SEMBOL_RES = (
+    re.compile(r"Sembol:\s*([A-Z0-9 ,]+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"Semb[oö]l:\s*([A-Z0-9 ,]+?)(?:\n|$)", re.IGNORECASE),
+)
+_TICKER_FORMAT_RE = re.compile(r"[A-Z][A-Z0-9]{2,9}")
+
+
 def parse_tickers(text: str) -> list[str]:
     """Mesajdan TUM hisse kodlarini cikart. 'Sembol: XX,YY,ZZ' formatinda arar.
 
@@ -402,13 +461,8 @@ def parse_tickers(text: str) -> list[str]:
         "Sembol: THYAO"               → ["THYAO"]
         "Sembol: AAA, BBB , CCC"     → ["AAA", "BBB", "CCC"]
     """
-    # Sembol satirini bul — sonraki satira kadar (\n ile durur)
-    patterns = [
-        r"Sembol:\s*([A-Z0-9 ,]+?)(?:\n|$)",
-        r"Semb[oö]l:\s*([A-Z0-9 ,]+?)(?:\n|$)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for sembol_re in _SEMBOL_RES:
+        match = sembol_re.search(text)
         if match:
             raw = match.group(1).strip()
             # Virgulle ayrilmis sembolleri parcala, bosluk/duplicate temizle
@@ -416,22 +470,27 @@ def parse_tickers(text: str) -> list[str]:
             for part in raw.split(","):
                 tk = part.strip().upper()
                 # Sadece harf+rakam (3-10 karakter), gecerli ticker formati
-                if tk and re.fullmatch(r"[A-Z][A-Z0-9]{2,9}", tk) and tk not in tickers:
+                if tk and _TICKER_FORMAT_RE.fullmatch(tk) and tk not in tickers:
                     tickers.append(tk)
             if tickers:
                 return tickers
     return []
 
 
+@functools.lru_cache(maxsize=16)
+def _price_patterns(label: str) -> tuple[re.Pattern, ...]:
+    """Etiket bazli fiyat regex'leri — etiket basina bir kez derlenir."""
+    return (
+        re.compile(rf"{label}[:\s]*?([\d]+[.,][\d]+)", re.IGNORECASE),
+        re.compile(rf"Anlık\s*{label}[:\s]*?([\d]+[.,][\d]+)", re.IGNORECASE),
+        re.compile(rf"Son\s*{label}[:\s]*?([\d]+[.,][\d]+)", re.IGNORECASE),
+    )
+
+
 def parse_price(text: str, label: str = "Fiyat") -> Decimal | None:
     """Mesajdan fiyat bilgisini cikart."""
-    patterns = [
-        rf"{label}[:\s]*?([\d]+[.,][\d]+)",
-        rf"Anlık\s*{label}[:\s]*?([\d]+[.,][\d]+)",
-        rf"Son\s*{label}[:\s]*?([\d]+[.,][\d]+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for price_re in _price_patterns(label):
+        match = price_re.search(text)
         if match:
             price_str = match.group(1).replace(",", ".")
             try:
@@ -441,6 +500,12 @@ def parse_price(text: str, label: str = "Fiyat") -> Decimal | None:
     return None
 
 
+_KAP_ID_RES = (
+    re.compile(r"HaberId[:\s]*(\d+)", re.IGNORECASE),
+    re.compile(r"NewsId[:\s]*(\d+)", re.IGNORECASE),
+)
+
+
 def parse_kap_id(text: str) -> str | None:
     """HaberId / NewsId alanini cikart.
 
@@ -449,13 +514,16 @@ def parse_kap_id(text: str) -> str | None:
     Ikisi de KAP'tan gelen ayni ID — farkli prefix ile yaziliyor.
     """
     # Once HaberId, sonra NewsId dene
-    for pattern in (r"HaberId[:\s]*(\d+)", r"NewsId[:\s]*(\d+)"):
-        match = re.search(pattern, text, re.IGNORECASE)
+    for kap_id_re in _KAP_ID_RES:
+        match = kap_id_re.search(text)
         if match:
             return match.group(1)
     return None
 
 
+_NEWS_TITLE_RE = re.compile(r"Ba[şs]l[ıi]k[:\s]+(.+?)(?:\n|$)", re.IGNORECASE)
+
+
 def parse_news_title(text: str) -> str | None:
     """Yeni bot formatindaki 'Baslik:' satirindan haberin asil basligini cikart.
 
@@ -466,7 +534,7 @@ def parse_news_title(text: str) -> str | None:
     Eski Matriks formatinda 'Baslik:' satiri yoktur, None doner.
     """
     # "Başlık:" veya "Baslik:" sonrasi satirin sonuna kadar
-    match = re.search(r"Ba[şs]l[ıi]k[:\s]+(.+?)(?:\n|$)", text, re.IGNORECASE)
+    match = _NEWS_TITLE_RE.search(text)
     if match:
         title = match.group(1).strip()
         # Anlamsiz / cok kisa basliklar
@@ -475,26 +543,102 @@ def parse_news_title(text: str) -> str | None:
     return None
 
 
+# Sayisal alanlar — her desenin TEK yakalama grubu var (grup adi = alan adi).
+# Onekler birbirinden farkli oldugu icin eslesmeler cakismaz; tek birlesik
+# desenle mesaj bir kez taranir (parse_message_fields).
+# Desenler _fold_case() edilmis metinde calisir (kucuk harf, ı/İ → i) —
+# IGNORECASE'in karakter basina case-folding maliyeti olmadan ayni eslesme.
+_EXPECTED_DATE_PAT = r"beklenen\s+işlem\s+g[üu]n[üu]:\s*(?P<expected_date>\d{4}-\d{2}-\d{2})"
+_GAP_PCT_PAT = r"açiliş\s+gap[:\s]*%?(?P<gap>[-]?[\d]+[.,][\d]+)"
+_PCT_CHANGE_PAT = r"anlik\s*:\s*(?P<pct_change>[+-]?\s*%?\s*[\d]+[.,][\d]+)"
+_PREV_CLOSE_PAT = r"önceki\s+kapaniş[:\s]*(?P<prev_close>[\d]+[.,][\d]+)"
+_THEO_OPEN_PAT = r"teorik\s+açiliş[:\s]*(?P<theo_open>[\d]+[.,][\d]+)"
+
+_EXPECTED_DATE_RE = re.compile(_EXPECTED_DATE_PAT)
+_GAP_PCT_RE = re.compile(_GAP_PCT_PAT)
+_PCT_CHANGE_RE = re.compile(_PCT_CHANGE_PAT)
+_PREV_CLOSE_RE = re.compile(_PREV_CLOSE_PAT)
+_THEO_OPEN_RE = re.compile(_THEO_OPEN_PAT)
+_MESSAGE_FIELDS_RE = re.compile(
+    "|".join((
+        _EXPECTED_DATE_PAT, _GAP_PCT_PAT, _PCT_CHANGE_PAT,
+        _PREV_CLOSE_PAT, _THEO_OPEN_PAT,
+    ))
+)
+
+
+def _fold_case(text: str) -> str:
+    """re.IGNORECASE karsiligi normalizasyon.
+
+    IGNORECASE altinda I/İ/ı/i birbirine eslesir; lower() 'İ'yi 'i' + U+0307
+    (birlesik nokta) yapar ve 'ı'yi oldugu gibi birakir — ikisi de 'i'ye cekilir.
+    """
+    return text.lower().replace("\u0307", "").replace("ı", "i")
+
+
+def _parse_iso_date(raw: str) -> date | None:
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+def _parse_decimal(raw: str) -> Decimal | None:
+    try:
+        return Decimal(raw.replace(",", "."))
+    except Exception:
+        return None
+
+
+def _normalize_pct(raw: str) -> str:
+    """'+ 3,56' → '+%3,56' — bosluk temizle, % isareti ekle."""
+    raw = raw.strip().replace(" ", "")
+    if "%" not in raw:
+        # +3,56 → +%3,56
+        if raw.startswith("+") or raw.startswith("-"):
+            raw = raw[0] + "%" + raw[1:]
+        else:
+            raw = "%" + raw
+    return raw
+
+
+_FIELD_CONVERTERS = {
+    "expected_date": _parse_iso_date,
+    "gap": _parse_decimal,
+    "pct_change": _normalize_pct,
+    "prev_close": _parse_decimal,
+    "theo_open": _parse_decimal,
+}
+
+
+def parse_message_fields(text: str) -> dict:
+    """Sayisal alanlari tek taramada cikart.
+
+    Her alan icin ilk eslesme alinir — ayri ayri parse_* cagrilariyla ayni
+    sonuc. Bulunamayan alan None.
+    Keys: expected_date, gap, pct_change, prev_close, theo_open
+    """
+    raw: dict[str, str] = {}
+    for match in _MESSAGE_FIELDS_RE.finditer(_fold_case(text)):
+        raw.setdefault(match.lastgroup, match.group(match.lastgroup))
+        if len(raw) == len(_FIELD_CONVERTERS):
+            break
+    return {
+        name: (convert(raw[name]) if name in raw else None)
+        for name, convert in _FIELD_CONVERTERS.items()
+    }
+
+
 def parse_expected_trading_date(text: str) -> date | None:
     """Beklenen islem gununu cikart: 'Beklenen İşlem Günü: 2026-02-09 (Pazartesi)'."""
-    match = re.search(r"Beklenen\s+[İI]şlem\s+G[üu]n[üu]:\s*(\d{4}-\d{2}-\d{2})", text, re.IGNORECASE)
-    if match:
-        try:
-            return date.fromisoformat(match.group(1))
-        except ValueError:
-            pass
-    return None
+    match = _EXPECTED_DATE_RE.search(_fold_case(text))
+    return _parse_iso_date(match.group(1)) if match else None
 
 
 def parse_gap_pct(text: str) -> Decimal | None:
     """Acilis gap yuzdesini cikart: 'Açılış Gap: %0.50'."""
-    match = re.search(r"[Aa]çılış\s+Gap[:\s]*%?([-]?[\d]+[.,][\d]+)", text, re.IGNORECASE)
-    if match:
-        try:
-            return Decimal(match.group(1).replace(",", "."))
-        except Exception:
-            pass
-    return None
+    match = _GAP_PCT_RE.search(_fold_case(text))
+    return _parse_decimal(match.group(1)) if match else None
 
 
 def parse_pct_change(text: str) -> str | None:
@@ -504,44 +648,20 @@ def parse_pct_change(text: str) -> str | None:
     Ornek: '+%3,56', '-%1.20', '+%0.45'
     """
     # Anlık: +%3,56  /  Anlık: -%1.20  /  Anlık:+%0,45
-    match = re.search(
-        r"Anl[ıi]k\s*:\s*([+-]?\s*%?\s*[\d]+[.,][\d]+)",
-        text, re.IGNORECASE
-    )
-    if match:
-        raw = match.group(1).strip()
-        # Normalize: bosluk temizle, % isareti ekle
-        raw = raw.replace(" ", "")
-        if "%" not in raw:
-            # +3,56 → +%3,56
-            if raw.startswith("+") or raw.startswith("-"):
-                raw = raw[0] + "%" + raw[1:]
-            else:
-                raw = "%" + raw
-        return raw
-    return None
+    match = _PCT_CHANGE_RE.search(_fold_case(text))
+    return _normalize_pct(match.group(1)) if match else None
 
 
 def parse_prev_close(text: str) -> Decimal | None:
     """Onceki kapanis fiyatini cikart."""
-    match = re.search(r"[Öö]nceki\s+Kapanış[:\s]*([\d]+[.,][\d]+)", text, re.IGNORECASE)
-    if match:
-        try:
-            return Decimal(match.group(1).replace(",", "."))
-        except Exception:
-            pass
-    return None
+    match = _PREV_CLOSE_RE.search(_fold_case(text))
+    return _parse_decimal(match.group(1)) if match else None
 
 
 def parse_theoretical_open(text: str) -> Decimal | None:
     """Teorik acilis fiyatini cikart."""
-    match = re.search(r"Teorik\s+[Aa]çılış[:\s]*([\d]+[.,][\d]+)", text, re.IGNORECASE)
-    if match:
-        try:
-            return Decimal(match.group(1).replace(",", "."))
-        except Exception:
-            pass
-    return None
+    match = _THEO_OPEN_RE.search(_fold_case(text))
+    return _parse_decimal(match.group(1)) if match else None
 
 
 def parse_sentiment(message_type: str) -> str:
@@ -549,15 +669,16 @@ def parse_sentiment(message_type: str) -> str:
     return "positive"
 
 
+_TITLE_PREFIXES = {
+    "seans_ici_pozitif": "⚡ Seans İçi Pozitif Haber Yakalandı - ",
+    "borsa_kapali": "🌙 Seans Dışı Pozitif Haber Yakalandı - ",
+    "seans_disi_acilis": "📊 Seans Dışı Haber Yakalanan Hisse Açılışı - ",
+}
+
+
 def build_parsed_title(message_type: str, ticker: str | None) -> str:
     """Mesaj tipi ve ticker'dan baslik olustur."""
-    ticker_str = ticker or "???"
-    type_labels = {
-        "seans_ici_pozitif": f"⚡ Seans İçi Pozitif Haber Yakalandı - {ticker_str}",
-        "borsa_kapali": f"🌙 Seans Dışı Pozitif Haber Yakalandı - {ticker_str}",
-        "seans_disi_acilis": f"📊 Seans Dışı Haber Yakalanan Hisse Açılışı - {ticker_str}",
-    }
-    return type_labels.get(message_type, f"Haber — {ticker_str}")
+    return _TITLE_PREFIXES.get(message_type, "Haber — ") + (ticker or "???")
 
 
 # Bilanco-paketi bildirim basliklari — bir bilanco aciklamasinda KAP'a 5+ ayri
@@ -586,6 +707,14 @@ def _is_bilanco_package_title(title: str) -> bool:
 # zaten kaydedildiyse ONU EZMEMELI. {ticker:period -> timestamp} (konsolide kaydedildi).
 _CONSOL_BILANCO_CACHE: dict[str, float] = {}
 
+# Eski Matriks formati: "Iliskilendirilen Haber Detayi: <keyword>"
+_HABER_DETAY_RE = re.compile(
+    r"[İI]li[sş]kilendirilen\s+Haber\s+Detay[ıiİ]:\s*\n?(.+)", re.IGNORECASE
+)
+
+# AI ozetindeki "%12,5" yuzdeleri — ilk ikisinin farki sentiment skoruna yazilir
+_SUMMARY_PCT_RE = re.compile(r"%\s*([\d]+[.,]?[\d]*)")
+
 
 # -------------------------------------------------------------------
 # Router — 6 ozel takvime dagit
@@ -1061,6 +1190,19 @@ async def _route_to_calendars(
 # Ana Poller Fonksiyonu
 # -------------------------------------------------------------------
 
+def _parse_chat_id(chat_id: str) -> int | None:
+    """Config'teki chat ID'yi Telegram'in dondurdugu int chat.id'ye cevirir.
+
+    Yazimi str(int) ile birebir ayni degilse (bosluk, '+', kanal adi) None —
+    eski string karsilastirmasinda da hicbir mesaj eslesmiyordu.
+    """
+    try:
+        chat_id_int = int(chat_id)
+    except (TypeError, ValueError):
+        return None
+    return chat_id_int if str(chat_id_int) == chat_id else None
+
+
 async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
     """Telegram kanalından yeni mesajları çek, parse et, DB'ye kaydet.
 
@@ -1101,7 +1243,34 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
     skipped_unknown_type = 0
     skipped_duplicate = 0
 
+    # chat.id int gelir — mesaj basina str() yerine int karsilastirma
+    chat_id_int = _parse_chat_id(chat_id)
+
+    # Islenebilecek mesajlar (dogru kanal + metin + message_id). Hic yoksa
+    # (baska chat, servis mesaji vb.) DB session'i hic acilmaz.
+    candidate_ids = [
+        message["message_id"]
+        for update in updates
+        if (message := update.get("channel_post") or update.get("message"))
+        and message.get("text")
+        and message.get("message_id")
+        and message.get("chat", {}).get("id") == chat_id_int
+    ] if chat_id_int is not None else []
+    if not candidate_ids:
+        _last_update_id = updates[-1].get("update_id", 0) + 1
+        logger.debug("Telegram: islenecek mesaj yok (%d update atlandi)", len(updates))
+        return 0
+
     async with async_session() as session:
+        # Batch'te DB'ye daha once yazilmis mesajlar — mesaj basina SELECT
+        # yerine tek IN sorgusu
+        existing_result = await session.execute(
+            select(TelegramNews.telegram_message_id).where(
+                TelegramNews.telegram_message_id.in_(candidate_ids)
+            )
+        )
+        existing_ids = set(existing_result.scalars().all())
+
         for update in updates:
             update_id = update.get("update_id", 0)
 
@@ -1113,11 +1282,7 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
             if not message:
                 continue
 
-            msg_chat_id = str(message.get("chat", {}).get("id", ""))
-            if msg_chat_id != chat_id:
-                skipped_chat += 1
-                continue
-
+            # En ucuz elemeler once: metin / message_id yoksa chat'e bakilmaz
             text = message.get("text", "")
             if not text:
                 skipped_notext += 1
@@ -1128,13 +1293,13 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
                 skipped_notext += 1
                 continue
 
+            if message.get("chat", {}).get("id") != chat_id_int:
+                skipped_chat += 1
+                continue
+            msg_chat_id = chat_id  # eslesti → ayni yazim (TelegramNews.chat_id)
+
             # Daha once kaydedilmis mi kontrol et
-            existing = await session.execute(
-                select(TelegramNews).where(
-                    TelegramNews.telegram_message_id == telegram_message_id
-                )
-            )
-            if existing.scalar_one_or_none():
+            if telegram_message_id in existing_ids:
                 skipped_duplicate += 1
                 continue
 
@@ -1197,11 +1362,12 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
 
             # Fiyat bilgisi KAYDEDILMEZ (veri ihlali)
             kap_id = parse_kap_id(text)
-            expected_date = parse_expected_trading_date(text)
-            gap = parse_gap_pct(text)
-            prev_close = parse_prev_close(text)
-            theo_open = parse_theoretical_open(text)
-            pct_change = parse_pct_change(text)  # Seans ici yuzdesel degisim
+            fields = parse_message_fields(text)
+            expected_date = fields["expected_date"]
+            gap = fields["gap"]
+            prev_close = fields["prev_close"]
+            theo_open = fields["theo_open"]
+            pct_change = fields["pct_change"]  # Seans ici yuzdesel degisim
             sentiment = parse_sentiment(message_type)
             title = build_parsed_title(message_type, ticker)
 
@@ -1248,10 +1414,7 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
 
             # 2) Eski format — "Iliskilendirilen Haber Detayi"
             if not matched_kw and kap_id:
-                detail_match = re.search(
-                    r"[İI]li[sş]kilendirilen\s+Haber\s+Detay[ıiİ]:\s*\n?(.+)",
-                    text, re.IGNORECASE
-                )
+                detail_match = _HABER_DETAY_RE.search(text)
                 if detail_match:
                     raw_kw = detail_match.group(1).strip()
                     # "Haber Detayi Bulunamadi" gibi anlamsiz degerler atlanir
@@ -1461,7 +1624,7 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
                     elif _pos_cue and not _neg_cue and _dir < 0:
                         _dir = abs(_dir)
                     try:
-                        _pcts = [float(p.replace(",", ".")) for p in re.findall(r"%\s*([\d]+[.,]?[\d]*)", ai_summary)[:2]]
+                        _pcts = [float(p.replace(",", ".")) for p in _SUMMARY_PCT_RE.findall(ai_summary)[:2]]
                         if len(_pcts) == 2 and abs(_pcts[0] - _pcts[1]) > 0:
                             _dir = (abs(_pcts[0] - _pcts[1])) * (1 if _dir > 0 else -1)
                     except (ValueError, TypeError):
@@ -2170,6 +2333,7 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
                     kap_url=kap_url,
                 )
                 session.add(news)
+                existing_ids.add(telegram_message_id)  # ayni batch'te tekrar gelirse
                 new_count += 1
 
             # ──────────────────────────────────────────────────────────────────
@@ -2191,6 +2355,7 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
                     await session.rollback()
                 except Exception:
                     pass
+                existing_ids.discard(telegram_message_id)
                 continue
 
             # Push bildirim — sadece should_notify True ise
@@ -2259,7 +2424,7 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
             # ----------------------------------------------------------------
             if _auto_tweet_on and should_notify and message_type != "seans_disi_acilis":  # seans_disi_acilis = sadece acilis gap, tweet atilmaz
                 try:
-                    from app.services.twitter_service import tweet_kap_news, _kap_tweet_counter
+                    from app.services.twitter_service import _kap_tweet_counter
 
                     # Restart sonrasi sayaci DB'den yukle (bir kerelik)
                     if _kap_tweet_counter["total"] == 0:
@@ -2305,7 +2470,10 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
                             _counter_val, ticker, tweet_kw, ai_score, kap_url,
                         )
 
-                        tw_success = tweet_kap_news(
+                        # Arka planda (sirali) — poll dongusu tweet'i beklemez
+                        _fire_and_forget(_send_kap_tweet(
+                            "TWEET-FLOW", "kap_haber",
+                            f"Anahtar: {tweet_kw} | AI: {ai_score}/10 | Sayac: {_counter_val}" if ai_score is None else f"Anahtar: {tweet_kw} | AI: {ai_score:.1f}/10 | Sayac: {_counter_val}",
                             ticker,
                             tweet_kw,
                             "positive",
@@ -2313,17 +2481,7 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
                             ai_summary=ai_summary,
                             kap_url=kap_url,
                             ai_hashtags=ai_hashtags,
-                        )
-                        logger.info(
-                            "[TWEET-FLOW] KAP tweet sonuc: %s (basarili=%s, ai_score=%s)",
-                            ticker, tw_success, ai_score,
-                        )
-
-                        from app.services.admin_telegram import notify_tweet_sent
-                        await notify_tweet_sent(
-                            "kap_haber", ticker, tw_success,
-                            f"Anahtar: {tweet_kw} | AI: {ai_score}/10 | Sayac: {_counter_val}" if ai_score is None else f"Anahtar: {tweet_kw} | AI: {ai_score:.1f}/10 | Sayac: {_counter_val}",
-                        )
+                        ))
                     else:
                         logger.info(
                             "[TWEET-FLOW] Sayac %d (skor=%.1f), tweet atlandi (%s: her %d'te 1): %s",
@@ -2380,7 +2538,6 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
 
             if _should_negative_tweet:
                 try:
-                    from app.services.twitter_service import tweet_kap_news
                     tweet_kw_neg = matched_kw
                     if not tweet_kw_neg or "BULUNAMADI" in tweet_kw_neg.upper() or tweet_kw_neg == ticker:
                         tweet_kw_neg = "Yeni KAP Bildirimi"
@@ -2388,22 +2545,15 @@ async def poll_telegram_messages(bot_token: str, chat_id: str) -> int:
                         "[TWEET-FLOW-NEG] Negatif KAP tweet baslatiliyor [%s]: %s | skor=%.1f | kw=%s",
                         _negative_category, ticker, ai_score, tweet_kw_neg,
                     )
-                    tw_neg_success = tweet_kap_news(
+                    _fire_and_forget(_send_kap_tweet(
+                        "TWEET-FLOW-NEG", "kap_haber_negatif",
+                        f"Anahtar: {tweet_kw_neg} | AI: {ai_score:.1f}/10 [{_negative_category}]",
                         ticker, tweet_kw_neg, "negative",
                         ai_score=ai_score,
                         ai_summary=ai_summary,
                         kap_url=kap_url,
                         ai_hashtags=ai_hashtags,
-                    )
-                    logger.info(
-                        "[TWEET-FLOW-NEG] Negatif KAP tweet sonuc: %s (basarili=%s, skor=%.1f)",
-                        ticker, tw_neg_success, ai_score,
-                    )
-                    from app.services.admin_telegram import notify_tweet_sent
-                    await notify_tweet_sent(
-                        "kap_haber_negatif", ticker, tw_neg_success,
-                        f"Anahtar: {tweet_kw_neg} | AI: {ai_score:.1f}/10 [{_negative_category}]",
-                    )
+                    ))
                 except Exception as tw_neg_err:
                     logger.error(
                         "[TWEET-FLOW-NEG] Negatif tweet hatasi: %s", tw_neg_err, exc_info=True,
@@ -2443,7 +2593,6 @@ async def poll_telegram():
         return
 
     async with _poll_lock:
-        from app.config import get_settings
         settings = get_settings()
 
         # Okuyucu bot token: sender bot kendi mesajlarini getUpdates'te goremez,
@@ -2455,6 +2604,11 @@ async def poll_telegram():
             logger.warning("TELEGRAM_READER_BOT_TOKEN ve TELEGRAM_BOT_TOKEN ayarlanmamis, poller atlaniyor")
             return
 
+        # Chat ID yoksa hicbir mesaj eslesmez — getUpdates cagrisi bosuna yapilir
+        if not chat_id:
+            logger.warning("TELEGRAM_CHAT_ID ayarlanmamis, poller atlaniyor")
+            return
+
         try:
             global _consecutive_errors
             count = await poll_telegram_messages(bot_token, chat_id)
@@ -21,17 +21,97 @@ logger = logging.getLogger(__name__)
 # Kara liste — silinen IPO ilk 2 kelime karsilastirmasi
 _SKIP_WORDS = {"a.ş.", "a.s.", "aş", "san.", "tic.", "ve", "ltd.", "şti.", "sti."}
 
+# Isim normalizasyonu eslestirme dongulerinde her DB satiri icin calisiyor —
+# regex ve kisaltma listesi modul seviyesinde bir kez olusturulur.
+_WHITESPACE_RE = re.compile(r"\s+")
+_NAME_ABBREVIATIONS = ("a.ş.", "aş", "a.s.", "san.", "tic.", "ve", "ltd.", "şti.")
+
 
 def _first_two_words_match(name1: str, name2: str) -> bool:
     """Iki sirket adinin ilk 2 anlamli kelimesi eslesiyor mu?"""
     def _get_words(n: str) -> list[str]:
-        words = re.sub(r"\s+", " ", n.strip()).lower().split()
+        words = _WHITESPACE_RE.sub(" ", n.strip()).lower().split()
         return [w for w in words if w not in _SKIP_WORDS][:2]
     w1 = _get_words(name1 or "")
     w2 = _get_words(name2 or "")
     return len(w1) >= 2 and len(w2) >= 2 and w1 == w2
 
 
+def _norm_company_name(n: str) -> str:
+    """Sirket adini normalize et: kucuk harf, \n temizle, kisaltmalari ac."""
+    n = n.replace("\n", " ").replace("\r", " ")
+    n = _WHITESPACE_RE.sub(" ", n).strip().lower()
+    # Yaygin kisaltmalari kaldir (eslesme kolayligi)
+    for abbr in _NAME_ABBREVIATIONS:
+        n = n.replace(abbr, "")
+    return _WHITESPACE_RE.sub(" ", n).strip()
+
+
+def _fuzzy_name_match(incoming_norm: str, db_norm: str) -> bool:
+    """Birebir normalize eslestirme veya biri digerini iceriyor."""
+    return (db_norm == incoming_norm
+            or incoming_norm.startswith(db_norm[:15])
+            or db_norm.startswith(incoming_norm[:15]))
+
+
+class IPOLookup:
+    """IPO tablosunun bellekteki eslestirme indeksleri.
+
+    create_or_update_ipo ile ayni oncelik: ticker > kap_notification_url >
+    birebir isim > normalize (fuzzy) isim. IPOService.load_lookup ile bir kez
+    kurulur; upsert_with_lookup her guncelleme/olusturmadan sonra satiri
+    yeniden isler — _apply_update isim/ticker/kap_url degistirebilir.
+    """
+
+    def __init__(self, rows):
+        self.by_ticker: dict[str, IPO] = {}
+        self.by_kap_url: dict[str, IPO] = {}
+        self.by_name: dict[str, IPO] = {}
+        # id(row) -> (normalize isim, row); dict sirasi fuzzy'de ilk eslesmeyi korur
+        self.normalized: dict[int, tuple[str, IPO]] = {}
+        # Kara liste — ilk olusturmada bir kez okunur (IPOService.upsert_with_lookup)
+        self.deleted_rows: list[DeletedIPO] | None = None
+        for row in rows:
+            self.index(row)
+
+    def index(self, row: IPO, old_keys: tuple = ()) -> None:
+        """row'u lookup'lara (yeniden) isler; eski anahtarlar row'a aitse silinir."""
+        for mapping, old in zip((self.by_ticker, self.by_kap_url, self.by_name), old_keys):
+            if old and mapping.get(old) is row:
+                del mapping[old]
+        if row.ticker:
+            self.by_ticker.setdefault(row.ticker, row)
+        if row.kap_notification_url:
+            self.by_kap_url.setdefault(row.kap_notification_url, row)
+        if row.company_name:
+            self.by_name.setdefault(row.company_name, row)
+        if norm := _norm_company_name(row.company_name or ""):
+            self.normalized[id(row)] = (norm, row)
+        else:
+            self.normalized.pop(id(row), None)
+
+    def find(self, data: dict) -> IPO | None:
+        """Gelen veriye uyan mevcut IPO (yoksa None)."""
+        existing = None
+        if data.get("ticker"):
+            existing = self.by_ticker.get(data["ticker"].upper())
+        if not existing and data.get("kap_notification_url"):
+            existing = self.by_kap_url.get(data["kap_notification_url"])
+        if not existing and data.get("company_name"):
+            existing = self.by_name.get(data["company_name"])
+            if not existing:
+                incoming_norm = _norm_company_name(data["company_name"])
+                if len(incoming_norm) >= 4:  # Cok kisa isimlerde false match onle
+                    for db_norm, row in self.normalized.values():
+                        if _fuzzy_name_match(incoming_norm, db_norm):
+                            logger.info(
+                                "IPO fuzzy eslesti: '%s' → '%s'",
+                                data["company_name"], row.company_name,
+                            )
+                            return row
+        return existing
+
+
 class IPOService:
     """Halka arz islemleri servisi."""
 
@@ -129,27 +209,14 @@ class IPOService:
 
             # Fuzzy eslestirme — \n temizligi, kisaltma farkliliklari
             if not existing:
-                import re
-                def _norm(n: str) -> str:
-                    """Sirket adini normalize et: kucuk harf, \n temizle, kisaltmalari ac."""
-                    n = n.replace("\n", " ").replace("\r", " ")
-                    n = re.sub(r"\s+", " ", n).strip().lower()
-                    # Yaygin kisaltmalari kaldir (eslesme kolayligi)
-                    for abbr in ["a.ş.", "aş", "a.s.", "san.", "tic.", "ve", "ltd.", "şti."]:
-                        n = n.replace(abbr, "")
-                    return re.sub(r"\s+", " ", n).strip()
-
-                incoming_norm = _norm(data["company_name"])
+                incoming_norm = _norm_company_name(data["company_name"])
                 if len(incoming_norm) >= 4:  # Cok kisa isimlerde false match onle
                     all_ipos_result = await self.db.execute(select(IPO))
                     for ipo_row in all_ipos_result.scalars().all():
-                        db_norm = _norm(ipo_row.company_name or "")
+                        db_norm = _norm_company_name(ipo_row.company_name or "")
                         if not db_norm:
                             continue
-                        # Birebir normalize eslestirme veya biri digerini iceriyor
-                        if (db_norm == incoming_norm
-                            or incoming_norm.startswith(db_norm[:15])
-                            or db_norm.startswith(incoming_norm[:15])):
+                        if _fuzzy_name_match(incoming_norm, db_norm):
                             existing = ipo_row
                             logger.info(
                                 "IPO fuzzy eslesti: '%s' → '%s'",
@@ -158,84 +225,7 @@ class IPOService:
                             break
 
         if existing:
-            # GUARD: trading durumundaki IPO'lari scraper'lar guncelleyemez.
-            # Islem basladiktan sonra bilgi cekmeye gerek yok — veri tamamlanmis.
-            # Sadece admin (allow_create=True) bu korumayı bypass edebilir.
-            if (
-                not allow_create
-                and existing.status == "trading"
-                and existing.trading_start is not None
-            ):
-                logger.debug(
-                    "IPO trading durumunda, guncelleme atlanıyor: %s",
-                    existing.ticker or existing.company_name,
-                )
-                return existing
-
-            # Guncelle — sadece None olmayan alanlari
-            # status alanini scraper'dan gelen veriyle GERI almayiz
-            # (auto_update_statuses zaten dogru statusu ayarlar)
-            protected_fields = {"status", "id", "created_at", "archived", "archived_at"}
-
-            # Admin korumasi: manual_fields'ta listelenen alanlar scraper tarafindan ezilemez
-            manual_locked = set()
-            if not allow_create and existing.manual_fields:
-                try:
-                    import json as _json
-                    fields = _json.loads(existing.manual_fields)
-                    if isinstance(fields, list):
-                        manual_locked = set(fields)
-                except (ValueError, TypeError):
-                    pass
-
-            for key, value in data.items():
-                if value is not None and hasattr(existing, key) and key not in protected_fields:
-                    if key in manual_locked:
-                        continue  # Admin kilidi — dokunma
-                    setattr(existing, key, value)
-            existing.updated_at = datetime.utcnow()
-
-            # ONEMLI: Arsivlenmis bir IPO'ya yeni veriler (subscription_start, ticker vb.)
-            # geliyorsa → arsivden cikar. Scraper yeni bilgi getirdiyse IPO hala aktif demektir.
-            if existing.archived:
-                new_has_dates = data.get("subscription_start") or data.get("subscription_end") or data.get("trading_start")
-                new_has_ticker = data.get("ticker")
-                if new_has_dates or new_has_ticker:
-                    existing.archived = False
-                    existing.archived_at = None
-                    logger.info(
-                        "IPO arsivden cikarildi (yeni veri geldi): %s — ticker=%s, sub_start=%s",
-                        existing.company_name, data.get("ticker"), data.get("subscription_start"),
-                    )
-                    # Arsivden cikinca status'u da kontrol et
-                    # subscription_start varsa ve bugun veya gecmisse → in_distribution
-                    # yoksa → newly_approved'a geri al
-                    if not existing.status or existing.status in ("archived",):
-                        existing.status = "newly_approved"
-
-            ipo = existing
-            # ★ TARİH-STATUS SENKRONU (BETAE 17→18 bug'ı): scraper tarihi her
-            # güncellediğinde status'u ANINDA tarihe göre düzelt — auto_update'in
-            # 2 saatlik turunu bekleme. subscription_start GELECEKTE ise status
-            # in_distribution'da KALAMAZ → newly_approved'a çekilir + flag sıfırlanır.
-            # (trading/awaiting_trading'e dokunma — onlar geçmiş aşama.)
-            try:
-                from zoneinfo import ZoneInfo as _ZI3
-                _td_now = datetime.now(_ZI3("Europe/Istanbul")).date()
-            except Exception:
-                _td_now = datetime.utcnow().date()
-            if (existing.status == "in_distribution"
-                    and existing.subscription_start
-                    and existing.subscription_start > _td_now):
-                existing.status = "newly_approved"
-                existing.distribution_tweeted = False
-                existing.distribution_completed = False
-                logger.warning(
-                    "TARİH-STATUS SENKRON: %s in_distribution → newly_approved "
-                    "(sub_start=%s gelecekte, scraper güncelledi)",
-                    existing.ticker or existing.company_name, existing.subscription_start,
-                )
-            logger.info(f"IPO guncellendi: {ipo.ticker or ipo.company_name}")
+            ipo = self._apply_update(existing, data, allow_create)
         else:
             if not allow_create:
                 # Yeni IPO olusturma izni yok — sadece SPK bulten ve admin yapabilir
@@ -245,70 +235,228 @@ class IPOService:
                 )
                 return None
 
-            # Kara liste kontrolu — admin tarafindan silinen sirketleri tekrar ekleme
-            incoming_name = data.get("company_name", "")
-            if incoming_name:
+            ipo = await self._create_new(data)
+            if ipo is None:
+                return None
+
+        await self.db.flush()
+        return ipo
+
+    async def load_lookup(self) -> IPOLookup:
+        """IPO tablosunu TEK SELECT ile okuyup eslestirme indekslerini kurar.
+
+        Rollback sonrasi da cagrilabilir: donen satirlar session'daki expire
+        olmus IPO instance'larini da yeniden doldurur.
+        """
+        result = await self.db.execute(select(IPO))
+        return IPOLookup(result.scalars().all())
+
+    async def upsert_with_lookup(
+        self, data: dict, lookup: IPOLookup, allow_create: bool = False,
+    ) -> IPO | None:
+        """create_or_update_ipo'nun bellekteki lookup ile calisan hali (flush etmez).
+
+        Eslesmeyen satir allow_create=True ise olusturulur (kara liste
+        DeletedIPO lookup basina bir kez okunur); aksi halde atlanir.
+        """
+        existing = lookup.find(data)
+        if existing:
+            old_keys = (existing.ticker, existing.kap_notification_url, existing.company_name)
+            ipo = self._apply_update(existing, data, allow_create)
+            lookup.index(existing, old_keys)
+            return ipo
+
+        if not allow_create:
+            logger.info(
+                f"IPO bulunamadi, olusturma atlanıyor (allow_create=False): "
+                f"{data.get('ticker') or data.get('company_name')}"
+            )
+            return None
+
+        if lookup.deleted_rows is None:
+            deleted_result = await self.db.execute(select(DeletedIPO))
+            lookup.deleted_rows = list(deleted_result.scalars().all())
+        ipo = await self._create_new(
+            data, deleted_rows=lookup.deleted_rows, check_duplicate=False,
+        )
+        if ipo is not None:
+            lookup.index(ipo)
+        return ipo
+
+    async def bulk_create_or_update(
+        self, items: list[dict], allow_create: bool = False,
+    ) -> list[IPO | None]:
+        """Toplu create_or_update_ipo — tek SELECT + tek flush.
+
+        Scraper'lar (InfoYatirim vb.) onlarca satiri tek seferde gunceller;
+        satir basina ticker/kap_url/isim sorgusu + fuzzy icin tum tabloyu
+        yeniden okumak yerine IPO tablosu bir kez yuklenir (load_lookup) ve
+        eslestirme bellekte yapilir. Ayni batch'te ikinci kez gelen sirket
+        guncel anahtarlarla eslesir, duplike olusmaz.
+
+        Returns:
+            items ile ayni sirada IPO (atlanan/kara listedeki satir icin None)
+        """
+        lookup = await self.load_lookup()
+        saved = [await self.upsert_with_lookup(data, lookup, allow_create) for data in items]
+        await self.db.flush()
+        return saved
+
+    async def _create_new(
+        self, data: dict, deleted_rows: list[DeletedIPO] | None = None,
+        check_duplicate: bool = True,
+    ) -> IPO | None:
+        """Eslesme bulunamayan veriden yeni IPO olusturur (flush etmez).
+
+        deleted_rows verilirse kara liste icin DeletedIPO tablosu tekrar
+        okunmaz (toplu yol). check_duplicate=False — cagiran isim eslesmesini
+        zaten yapti, ayni bulten+isim sorgusu atlanir.
+        """
+        # Kara liste kontrolu — admin tarafindan silinen sirketleri tekrar ekleme
+        incoming_name = data.get("company_name", "")
+        if incoming_name:
+            if deleted_rows is None:
                 deleted_result = await self.db.execute(select(DeletedIPO))
-                for del_row in deleted_result.scalars().all():
-                    if _first_two_words_match(incoming_name, del_row.company_name):
-                        logger.info(
-                            "IPO kara listede, eklenmedi: '%s' ≈ '%s' (silindi: %s)",
-                            incoming_name, del_row.company_name,
-                            del_row.deleted_at.strftime("%Y-%m-%d") if del_row.deleted_at else "?",
-                        )
-                        return None
-
-            # Son kontrol — DB'ye flush yaparak race condition'da duplicate onle
-            # (ayni company_name + spk_bulletin_no kombinasyonu zaten varsa ekleme)
-            if data.get("company_name") and data.get("spk_bulletin_no"):
-                from sqlalchemy import and_ as _and2
-                _dup_result = await self.db.execute(
-                    select(IPO).where(
-                        _and2(
-                            IPO.company_name == data["company_name"],
-                            IPO.spk_bulletin_no == data["spk_bulletin_no"],
-                        )
+                deleted_rows = deleted_result.scalars().all()
+            for del_row in deleted_rows:
+                if _first_two_words_match(incoming_name, del_row.company_name):
+                    logger.info(
+                        "IPO kara listede, eklenmedi: '%s' ≈ '%s' (silindi: %s)",
+                        incoming_name, del_row.company_name,
+                        del_row.deleted_at.strftime("%Y-%m-%d") if del_row.deleted_at else "?",
+                    )
+                    return None
+
+        # Son kontrol — DB'ye flush yaparak race condition'da duplicate onle
+        # (ayni company_name + spk_bulletin_no kombinasyonu zaten varsa ekleme)
+        if check_duplicate and data.get("company_name") and data.get("spk_bulletin_no"):
+            from sqlalchemy import and_ as _and2
+            _dup_result = await self.db.execute(
+                select(IPO).where(
+                    _and2(
+                        IPO.company_name == data["company_name"],
+                        IPO.spk_bulletin_no == data["spk_bulletin_no"],
                     )
                 )
-                _dup_existing = _dup_result.scalar_one_or_none()
-                if _dup_existing:
-                    logger.warning(
-                        "IPO duplicate onlendi (ayni bulten+isim): %s (%s)",
-                        data["company_name"], data["spk_bulletin_no"],
+            )
+            _dup_existing = _dup_result.scalar_one_or_none()
+            if _dup_existing:
+                logger.warning(
+                    "IPO duplicate onlendi (ayni bulten+isim): %s (%s)",
+                    data["company_name"], data["spk_bulletin_no"],
+                )
+                return _dup_existing
+
+        # Yeni olustur — sadece SPK bulten veya admin kaynaklarından
+        ipo = IPO(**{k: v for k, v in data.items() if hasattr(IPO, k) and v is not None})
+        self.db.add(ipo)
+        logger.info(f"Yeni IPO olusturuldu: {ipo.ticker or ipo.company_name}")
+
+        # NOT: Tweet artik burada atilmiyor.
+        # check_spk_bulletins() icerisinde tum onaylar toplandiktan sonra
+        # tweet_new_ipos_batch() ile tek tweet olarak atiliyor.
+
+        # SPKApplication tablosunda varsa → approved yap
+        try:
+            from sqlalchemy import and_ as _and
+            from app.models.spk_application import SPKApplication as _SPKApp
+            _spk_result = await self.db.execute(
+                select(_SPKApp).where(
+                    _and(
+                        _SPKApp.status == "pending",
+                        _SPKApp.company_name.ilike(
+                            f"%{ipo.company_name[:30]}%"
+                        ),
                     )
-                    return _dup_existing
+                )
+            )
+            for _spk_app in _spk_result.scalars().all():
+                _spk_app.status = "approved"
+                logger.info("SPKApplication approved: %s (id=%d)", _spk_app.company_name, _spk_app.id)
+        except Exception:
+            pass  # SPK listesi guncelleme hatasi sistemi etkilemez
+        return ipo
 
-            # Yeni olustur — sadece SPK bulten veya admin kaynaklarından
-            ipo = IPO(**{k: v for k, v in data.items() if hasattr(IPO, k) and v is not None})
-            self.db.add(ipo)
-            logger.info(f"Yeni IPO olusturuldu: {ipo.ticker or ipo.company_name}")
+    def _apply_update(self, existing: IPO, data: dict, allow_create: bool) -> IPO:
+        """Mevcut IPO kaydini scraper verisiyle gunceller (flush etmez)."""
+        # GUARD: trading durumundaki IPO'lari scraper'lar guncelleyemez.
+        # Islem basladiktan sonra bilgi cekmeye gerek yok — veri tamamlanmis.
+        # Sadece admin (allow_create=True) bu korumayı bypass edebilir.
+        if (
+            not allow_create
+            and existing.status == "trading"
+            and existing.trading_start is not None
+        ):
+            logger.debug(
+                "IPO trading durumunda, guncelleme atlanıyor: %s",
+                existing.ticker or existing.company_name,
+            )
+            return existing
 
-            # NOT: Tweet artik burada atilmiyor.
-            # check_spk_bulletins() icerisinde tum onaylar toplandiktan sonra
-            # tweet_new_ipos_batch() ile tek tweet olarak atiliyor.
+        # Guncelle — sadece None olmayan alanlari
+        # status alanini scraper'dan gelen veriyle GERI almayiz
+        # (auto_update_statuses zaten dogru statusu ayarlar)
+        protected_fields = {"status", "id", "created_at", "archived", "archived_at"}
 
-            # SPKApplication tablosunda varsa → approved yap
+        # Admin korumasi: manual_fields'ta listelenen alanlar scraper tarafindan ezilemez
+        manual_locked = set()
+        if not allow_create and existing.manual_fields:
             try:
-                from sqlalchemy import and_ as _and
-                from app.models.spk_application import SPKApplication as _SPKApp
-                _spk_result = await self.db.execute(
-                    select(_SPKApp).where(
-                        _and(
-                            _SPKApp.status == "pending",
-                            _SPKApp.company_name.ilike(
-                                f"%{ipo.company_name[:30]}%"
-                            ),
-                        )
-                    )
-                )
-                for _spk_app in _spk_result.scalars().all():
-                    _spk_app.status = "approved"
-                    logger.info("SPKApplication approved: %s (id=%d)", _spk_app.company_name, _spk_app.id)
-            except Exception:
-                pass  # SPK listesi guncelleme hatasi sistemi etkilemez
+                import json as _json
+                fields = _json.loads(existing.manual_fields)
+                if isinstance(fields, list):
+                    manual_locked = set(fields)
+            except (ValueError, TypeError):
+                pass
 
-        await self.db.flush()
-        return ipo
+        for key, value in data.items():
+            if value is not None and hasattr(existing, key) and key not in protected_fields:
+                if key in manual_locked:
+                    continue  # Admin kilidi — dokunma
+                setattr(existing, key, value)
+        existing.updated_at = datetime.utcnow()
+
+        # ONEMLI: Arsivlenmis bir IPO'ya yeni veriler (subscription_start, ticker vb.)
+        # geliyorsa → arsivden cikar. Scraper yeni bilgi getirdiyse IPO hala aktif demektir.
+        if existing.archived:
+            new_has_dates = data.get("subscription_start") or data.get("subscription_end") or data.get("trading_start")
+            new_has_ticker = data.get("ticker")
+            if new_has_dates or new_has_ticker:
+                existing.archived = False
+                existing.archived_at = None
+                logger.info(
+                    "IPO arsivden cikarildi (yeni veri geldi): %s — ticker=%s, sub_start=%s",
+                    existing.company_name, data.get("ticker"), data.get("subscription_start"),
+                )
+                # Arsivden cikinca status'u da kontrol et
+                # subscription_start varsa ve bugun veya gecmisse → in_distribution
+                # yoksa → newly_approved'a geri al
+                if not existing.status or existing.status in ("archived",):
+                    existing.status = "newly_approved"
+
+        # ★ TARİH-STATUS SENKRONU (BETAE 17→18 bug'ı): scraper tarihi her
+        # güncellediğinde status'u ANINDA tarihe göre düzelt — auto_update'in
+        # 2 saatlik turunu bekleme. subscription_start GELECEKTE ise status
+        # in_distribution'da KALAMAZ → newly_approved'a çekilir + flag sıfırlanır.
+        # (trading/awaiting_trading'e dokunma — onlar geçmiş aşama.)
+        try:
+            from zoneinfo import ZoneInfo as _ZI3
+            _td_now = datetime.now(_ZI3("Europe/Istanbul")).date()
+        except Exception:
+            _td_now = datetime.utcnow().date()
+        if (existing.status == "in_distribution"
+                and existing.subscription_start
+                and existing.subscription_start > _td_now):
+            existing.status = "newly_approved"
+            existing.distribution_tweeted = False
+            existing.distribution_completed = False
+            logger.warning(
+                "TARİH-STATUS SENKRON: %s in_distribution → newly_approved "
+                "(sub_start=%s gelecekte, scraper güncelledi)",
+                existing.ticker or existing.company_name, existing.subscription_start,
+            )
+        logger.info(f"IPO guncellendi: {existing.ticker or existing.company_name}")
+        return existing
 
     async def update_ipo_status(self, ipo_id: int, new_status: str) -> Optional[IPO]:
         """Halka arz durumunu gunceller."""
@@ -22,41 +22,56 @@ from sqlalchemy import text as sa_text
 logger = logging.getLogger(__name__)
 
 
-async def _complete_bulletin(bno_str: str, db) -> dict:
-    """Tek bir bültenin analiz + tweet + push'unu tamamlar (reprocess çekirdeği)."""
-    import asyncio as _aio
-    from app.scrapers.spk_bulletin_scraper import SPKBulletinScraper
-    from app.services.twitter_service import (
-        tweet_spk_bulletin_analysis, _generate_bulletin_analysis_sync,
-    )
-    from app.models.pending_tweet import PendingTweet
-    from app.services.notification import NotificationService
+async def _fetch_bulletin_text(bno_str: str, sc) -> tuple[str, str | None]:
+    """Bultenin PDF'ini indirip AI analiz metnini cikarir.
 
+    Returns:
+        (full_text, hata_sebebi) — basarida hata_sebebi None
+    """
     try:
         _y, _n = bno_str.split("/")
         year, no = int(_y), int(_n)
     except Exception:
-        return {"ok": False, "reason": "bad_bulletin_no"}
+        return "", "bad_bulletin_no"
 
-    sc = SPKBulletinScraper()
-    full_text = ""
     try:
         lst = await sc.fetch_bulletin_list(year)
         target = next((b for b in lst if b.get("bulletin_no") == (year, no)), None)
         if not target:
-            return {"ok": False, "reason": "not_in_list"}
+            return "", "not_in_list"
         _appr, full_text = await sc.process_bulletin(target["pdf_url"], (year, no))
     except Exception as e:
         logger.error("[BULTEN-CATCHUP] %s fetch/process hata: %s", bno_str, e)
-        return {"ok": False, "reason": f"fetch_error:{type(e).__name__}"}
-    finally:
-        try:
-            await sc.client.aclose()
-        except Exception:
-            pass
+        return "", f"fetch_error:{type(e).__name__}"
 
     if not full_text:
-        return {"ok": False, "reason": "empty_pdf"}
+        return "", "empty_pdf"
+    return full_text, None
+
+
+async def _complete_bulletin(
+    bno_str: str, db, prefetched: tuple[str, str | None] | None = None,
+) -> dict:
+    """Tek bir bültenin analiz + tweet + push'unu tamamlar (reprocess çekirdeği).
+
+    prefetched: _fetch_bulletin_text sonucu — verilmezse PDF burada indirilir.
+    """
+    import asyncio as _aio
+    from app.scrapers.spk_bulletin_scraper import SPKBulletinScraper
+    from app.services.twitter_service import (
+        tweet_spk_bulletin_analysis, _generate_bulletin_analysis_sync,
+    )
+    from app.models.pending_tweet import PendingTweet
+    from app.services.notification import NotificationService
+    from app.utils.http_client import get_http_client
+
+    if prefetched is None:
+        prefetched = await _fetch_bulletin_text(
+            bno_str, SPKBulletinScraper(get_http_client(verify=False)),
+        )
+    full_text, reason = prefetched
+    if reason:
+        return {"ok": False, "reason": reason}
 
     # AI analiz (thread — event loop bloklanmasın)
     ai_text = await _aio.to_thread(_generate_bulletin_analysis_sync, full_text, bno_str)
@@ -109,7 +124,10 @@ async def _complete_bulletin(bno_str: str, db) -> dict:
 
 async def catchup_incomplete_bulletins() -> dict:
     """Son 24 saatte IPO'su oluşmuş ama push flag'i EKSİK bültenleri tamamlar."""
+    import asyncio
     from app.database import async_session
+    from app.scrapers.spk_bulletin_scraper import SPKBulletinScraper
+    from app.utils.http_client import get_http_client
 
     completed = []
     try:
@@ -140,6 +158,7 @@ async def catchup_incomplete_bulletins() -> dict:
             except Exception as _st_err:
                 logger.warning("[BULTEN-CATCHUP] scraper_state okunamadi: %s", _st_err)
 
+            missing = []
             for bno in recent:
                 push_exists = (await db.execute(sa_text(
                     "SELECT 1 FROM pending_tweets WHERE source = :s LIMIT 1"
@@ -149,7 +168,19 @@ async def catchup_incomplete_bulletins() -> dict:
                 logger.warning(
                     "[BULTEN-CATCHUP] %s EKSİK (IPO var, push flag yok) — tamamlanıyor", bno,
                 )
-                res = await _complete_bulletin(bno, db)
+                missing.append(bno)
+
+            # PDF indirme + parse tum eksik bultenler icin es zamanli; push/tweet
+            # (DB session + dis servisler) asagida sirayla yapilir.
+            fetched = []
+            if missing:
+                sc = SPKBulletinScraper(get_http_client(verify=False))
+                fetched = await asyncio.gather(
+                    *(_fetch_bulletin_text(bno, sc) for bno in missing)
+                )
+
+            for bno, prefetched in zip(missing, fetched):
+                res = await _complete_bulletin(bno, db, prefetched)
                 completed.append({"bulletin": bno, **res})
 
                 # Admin'e bilgi
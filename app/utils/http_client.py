@@ -0,0 +1,56 @@
+"""Paylasimli httpx.AsyncClient.
+
+Scheduler her tick'te yeni scraper olusturuyor; her scraper kendi
+AsyncClient'ini acinca TLS handshake ve TCP baglantisi her seferinde
+sifirdan kuruluyordu. Bu modul uygulama omru boyunca tek bir client
+tutar — keep-alive baglantilar tick'ler arasinda yeniden kullanilir.
+
+Client'lar ilk get_http_client() cagrisinda lazy olusturulur; lifespan
+kapanista close_http_client() ile kapatir. Scraper'lar kendi header'larini
+istek bazinda gonderir (client ortak, header seti kaynaga ozel).
+
+SSL dogrulamasi client seviyesinde oldugu icin verify=False isteyen
+kaynaklar (SPK — sertifika zinciri sorunlu) ayri bir client kullanir.
+
+HTTP/2 (h2 paketi kuruluysa) acik: ayni host'a giden istekler (SPK bulten
+listesi + PDF'ler, ihrac API) tek TLS baglantisi uzerinden multiplex edilir.
+Sunucu h2 desteklemiyorsa httpx ALPN ile HTTP/1.1'e duser.
+"""
+
+import importlib.util
+
+import httpx
+
+# verify -> client
+_clients: dict[bool, httpx.AsyncClient] = {}
+
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+LIMITS = httpx.Limits(
+    max_connections=50,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+
+
+def get_http_client(verify: bool = True) -> httpx.AsyncClient:
+    """Ortak AsyncClient'i dondurur (yoksa / kapandiysa olusturur)."""
+    client = _clients.get(verify)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=30.0,
+            follow_redirects=True,
+            limits=LIMITS,
+            verify=verify,
+            http2=HTTP2_ENABLED,
+        )
+        _clients[verify] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Ortak client'lari kapatir — sadece uygulama kapanisinda cagrilir."""
+    for client in list(_clients.values()):
+        if not client.is_closed:
+            await client.aclose()
+    _clients.clear()